@@ -1,6 +1,6 @@
 {
     "name": "Payment - Algorand (Pera Wallet)",
-    "version": "19.0.1.0.0",
+    "version": "19.0.1.1.0",
     "license": "AGPL-3",
     "author": "Odoo Community Association (OCA)",
     "website": "https://github.com/OCA/payment",
@@ -12,12 +12,19 @@
     "images": ["static/description/icon.png"],
     "data": [
         "security/ir.model.access.csv",
+        "security/algorand_security.xml",
+        "wizards/algorand_payment_export_views.xml",
+        "views/algorand_asset_views.xml",
+        "views/algorand_payment_receipt_views.xml",
+        "views/algorand_revenue_summary_views.xml",
         "views/payment_form.xml",
         "views/payment_method_views.xml",
         "views/payment_provider_views.xml",
         "views/shop_confirmation.xml",
         "data/payment_provider_data.xml",
         "data/payment_method_data.xml",
+        "data/algorand_asset_data.xml",
+        "data/ir_cron_data.xml",
     ],
     "assets": {
         "web.assets_frontend": [
@@ -12,6 +12,18 @@ PAYMENT_METHODS_MAPPING = {
     "algorand_pera": "algorand_pera",
 }
 
+# Public algod endpoints used by default for each network.
+ALGOD_URLS_BY_NETWORK = {
+    "mainnet": "https://mainnet-api.algonode.cloud",
+    "testnet": "https://testnet-api.algonode.cloud",
+}
+
+# Genesis IDs of the networks, used to check where a signed transaction is valid.
+GENESIS_IDS_BY_NETWORK = {
+    "mainnet": "mainnet-v1.0",
+    "testnet": "testnet-v1.0",
+}
+
 # Common Algorand Standard Asset (ASA) constants used by the module.
 # Note: IDs are well-known public ASAs for USDC on Algorand.
 # - MainNet USDC (Circle): 31566704
@@ -23,3 +35,6 @@ USDC_ASA_IDS_BY_NETWORK = {
 
 # Number of fractional decimals for USDC on Algorand
 USDC_DECIMALS = 6
+
+# Number of fractional decimals for ALGO (1 ALGO = 10^6 microAlgos)
+ALGO_DECIMALS = 6
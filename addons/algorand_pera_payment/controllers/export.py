@@ -0,0 +1,75 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import datetime
+import logging
+
+from werkzeug.exceptions import BadRequest
+
+from odoo import fields, http
+from odoo.http import content_disposition, request
+
+from ..tools import export
+
+_logger = logging.getLogger(__name__)
+
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+class AlgorandPaymentExportController(http.Controller):
+
+    @http.route(
+        "/payment/algorand_pera/export",
+        type="http",
+        auth="user",
+        methods=["GET"],
+    )
+    def algorand_pera_export(self, date_from, date_to, file_format="csv", **kwargs):
+        """Stream the Algorand payments confirmed between two dates.
+
+        :param str date_from: The first day of the export, as `YYYY-MM-DD`.
+        :param str date_to: The last day of the export, as `YYYY-MM-DD`.
+        :param str file_format: `csv` or `xlsx`.
+        """
+        request.env["algorand.payment.receipt"].check_access("read")
+        try:
+            date_from = fields.Date.to_date(date_from)
+            date_to = fields.Date.to_date(date_to)
+        except ValueError as e:
+            raise BadRequest(str(e)) from e
+        if file_format not in CONTENT_TYPES or not date_from or not date_to:
+            raise BadRequest()
+
+        _logger.info(
+            "[Algorand][export] %s export from %s to %s requested by uid %s",
+            file_format,
+            date_from,
+            date_to,
+            request.env.uid,
+        )
+        rows = export.iter_receipt_rows(
+            request.env.registry,
+            request.env.companies.ids,
+            datetime.datetime.combine(date_from, datetime.time.min),
+            datetime.datetime.combine(
+                date_to + datetime.timedelta(days=1), datetime.time.min
+            ),
+        )
+        if file_format == "xlsx":
+            file = export.write_xlsx(rows)
+            body = export.iter_file(file)
+        else:
+            body = export.iter_csv(rows)
+
+        filename = f"algorand_payments_{date_from}_{date_to}.{file_format}"
+        return request.make_response(
+            body,
+            headers=[
+                ("Content-Type", CONTENT_TYPES[file_format]),
+                ("Content-Disposition", content_disposition(filename)),
+                ("Cache-Control", "no-store"),
+            ],
+        )
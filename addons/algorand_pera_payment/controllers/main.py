@@ -1,13 +1,23 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+import base64
 import logging
+import re
+
+from werkzeug.exceptions import Forbidden
 
 from odoo import http
+from odoo.exceptions import ValidationError
 from odoo.http import request
+from odoo.tools import SQL
+
+from ..tools import algod, profiling, rate_limit
 
 _logger = logging.getLogger(__name__)
 
+ALGORAND_ADDRESS_RE = re.compile(r"^[A-Z2-7]{58}$")
+
 
 class PeraPaymentController(http.Controller):
 
@@ -18,6 +28,8 @@ class PeraPaymentController(http.Controller):
         methods=["GET", "POST"],
         csrf=False,
     )
+    @rate_limit.limit()
+    @profiling.profiled("/payment/algorand_pera/form")
     def algorand_pera_form(self, **kwargs):
         """Display the Algorand Pera Wallet payment form."""
         _logger.info(
@@ -45,7 +57,7 @@ class PeraPaymentController(http.Controller):
         rendering_values = {
             "tx": tx,
             "provider": provider,
-            "merchant_address": provider.algorand_merchant_address,
+            "merchant_address": provider._algorand_get_config()["merchant_address"],
             "amount_algo": tx.amount,
             "currency": tx.currency_id.name,
             "order_id": tx.reference,
@@ -60,57 +72,100 @@ class PeraPaymentController(http.Controller):
         return request.render("algorand_pera_payment.payment_form", rendering_values)
 
     @http.route(
-        "/payment/algorand_pera/process", type="json", auth="public", csrf=False
+        "/payment/algorand_pera/preflight", type="json", auth="public", csrf=False
     )
-    def algorand_pera_process(self, **kwargs):
-        """Process the Algorand payment after blockchain confirmation.
+    @rate_limit.limit(json_route=True)
+    @profiling.profiled("/payment/algorand_pera/preflight")
+    def algorand_pera_preflight(self, **kwargs):
+        """Check that the connected wallet can pay before asking it to sign.
+
+        ENTRY POINT: Called by frontend before the Pera Wallet signing prompt,
+        so that underfunded or non-opted-in wallets are rejected without a
+        signature, a broadcast and a failed round trip.
+        """
+        tx_id = kwargs.get("tx_id")
+        sender_address = kwargs.get("sender_address")
+        if not tx_id or not sender_address:
+            return {"error": True, "message": "Missing transaction data"}
+        if not ALGORAND_ADDRESS_RE.match(sender_address):
+            return {"error": True, "message": "Invalid sender address"}
 
-        ENTRY POINT: Called by frontend after blockchain transaction is
-        broadcast
+        tx = request.env["payment.transaction"].sudo().browse(int(tx_id)).exists()
+        if not tx or tx.provider_code != "algorand_pera":
+            return {"error": True, "message": "Transaction not found"}
+        return tx._algorand_preflight(sender_address)
+
+    @http.route("/payment/algorand_pera/submit", type="json", auth="public", csrf=False)
+    @rate_limit.limit(json_route=True)
+    @profiling.profiled("/payment/algorand_pera/submit")
+    def algorand_pera_submit(self, **kwargs):
+        """Relay a signed payment to the network and wait for its confirmation.
 
-        This is called by the frontend after the user signs and broadcasts
-        the transaction via Pera Wallet. It receives the transaction hash
-        and updates the payment.transaction record.
+        ENTRY POINT: Called by frontend once Pera Wallet has signed the
+        transaction, instead of broadcasting it from the browser.
 
         Flow:
-        1. Validate payment data from frontend
-        2. Update transaction record using _process()
-        3. Monitor transaction for /payment/status page
-        4. Confirm the associated sale order
-        5. Save session to ensure state is persisted
-        6. Return success to trigger frontend redirect
+        1. Decode the signed transaction and check receiver, asset, amount and
+           note against the payment.transaction, rejecting a transfer already
+           relayed for another one
+        2. Broadcast it over the server's pooled algod connection
+        3. Commit the pending state, then wait a bounded time for the next
+           blocks
+        4. If confirmed, process the transaction and confirm the sale order
+        5. Return the final state; still pending transactions are finalized
+           by the pending-check cron
         """
-        _logger.info(
-            "[Algorand][algorand_pera_process] "
-            "==================== CALLED ===================="
-        )
-
         tx_id = kwargs.get("tx_id")
-        tx_hash = kwargs.get("tx_hash")
-        sender_address = kwargs.get("sender_address")
-        error_message = kwargs.get("error_message")
+        signed_txn = kwargs.get("signed_txn")
+        if not tx_id or not signed_txn:
+            return {"error": True, "message": "Missing transaction data"}
 
-        _logger.info(
-            "[Algorand][algorand_pera_process] Payload: tx_id=%s tx_hash=%s "
-            "sender=%s error=%s",
-            tx_id,
-            tx_hash,
-            sender_address,
-            error_message,
+        tx = request.env["payment.transaction"].sudo().browse(int(tx_id)).exists()
+        if not tx or tx.provider_code != "algorand_pera":
+            return {"error": True, "message": "Transaction not found"}
+
+        # Serialize concurrent submissions of the same transaction: a second
+        # one waits for the first to commit its txid, then is retried
+        request.env.cr.execute(
+            SQL("SELECT id FROM payment_transaction WHERE id = %s FOR UPDATE", tx.id)
         )
+        try:
+            stxn = tx._algorand_decode_signed_transaction(signed_txn)
+            tx._algorand_check_signed_transaction(stxn)
+        except ValidationError as e:
+            _logger.warning(
+                "[Algorand][submit] Rejected signed transaction for %s: %s",
+                tx.reference,
+                e,
+            )
+            return {"error": True, "message": str(e), "type": "invalid_transaction"}
 
-        # Handle error cases from frontend
-        if error_message:
-            if "overspend" in error_message.lower():
-                return {
-                    "error": True,
-                    "message": (
-                        "Insufficient funds. Please add more ALGO to your wallet "
-                        "to complete this payment."
-                    ),
-                    "type": "insufficient_funds",
-                }
-            else:
+        config = tx.provider_id._algorand_get_config()
+        tx_hash = stxn.transaction.get_txid()
+        if tx.algorand_tx_id == tx_hash:
+            _logger.info(
+                "[Algorand][submit] %s already relayed, waiting for it", tx_hash
+            )
+        else:
+            try:
+                tx_hash = algod.send_raw_transaction(
+                    config["node_url"],
+                    base64.b64decode(signed_txn),
+                    token=config["node_token"],
+                )
+            except algod.AlgodError as e:
+                _logger.warning(
+                    "[Algorand][submit] Broadcast failed for %s: %s", tx.reference, e
+                )
+                if "overspend" in str(e).lower():
+                    return {
+                        "error": True,
+                        "message": (
+                            "Insufficient funds. Please add more ALGO to your wallet "
+                            "to complete this payment."
+                        ),
+                        "type": "insufficient_funds",
+                    }
                 return {
                     "error": True,
                     "message": (
@@ -120,36 +175,118 @@ class PeraPaymentController(http.Controller):
                     "type": "payment_error",
                 }
 
-        # Validate required payment data
-        if not tx_id or not tx_hash:
-            return {"error": True, "message": "Missing transaction data"}
-
-        # Load the payment transaction record
-        tx = request.env["payment.transaction"].sudo().browse(int(tx_id))
-        if not tx.exists():
-            return {"error": True, "message": "Transaction not found"}
+            sender_address = stxn.transaction.sender
+            tx._set_pending()
+            tx.write(
+                {
+                    "provider_reference": tx_hash,
+                    "algorand_tx_id": tx_hash,
+                    "algorand_sender_address": sender_address,
+                    "algorand_network": config["network"],
+                    "algorand_last_valid_round": stxn.transaction.last_valid_round,
+                }
+            )
+        # Release the row locks before waiting on the network
+        request.env.cr.commit()
 
         try:
+            info = algod.wait_for_confirmation(
+                config["node_url"],
+                tx_hash,
+                tx._algorand_get_confirmation_timeout(),
+                token=config["node_token"],
+            )
+        except algod.PoolError as e:
+            _logger.warning(
+                "[Algorand][submit] Transaction %s rejected from the pool: %s",
+                tx_hash,
+                e,
+            )
+            tx._set_error(str(e))
+            return {"error": True, "message": str(e), "type": "payment_error"}
+        except algod.AlgodError as e:
+            # The transaction was broadcast and may still be committed: leave
+            # it pending for the pending-check cron
+            _logger.warning(
+                "[Algorand][submit] Could not wait for %s, left pending: %s",
+                tx_hash,
+                e,
+            )
+            info = None
+
+        if not info:
             _logger.info(
-                "[Algorand][process] Tx record: reference=%s amount=%s "
-                "currency=%s provider=%s",
-                tx.reference,
-                tx.amount,
-                tx.currency_id and tx.currency_id.name,
-                tx.provider_code,
+                "[Algorand][submit] Transaction %s still pending after the wait",
+                tx_hash,
+            )
+            from odoo.addons.payment.controllers.post_processing import (
+                PaymentPostProcessing,
             )
-        except Exception as e:
-            _logger.warning("[Algorand][process] Failed to log tx record: %s", e)
 
-        # Process the transaction using Odoo's standard payment flow
-        # This updates transaction state and triggers payment creation
-        data = {
-            "reference": tx.reference,
+            PaymentPostProcessing.monitor_transaction(tx)
+            return {"success": True, "state": "pending", "tx_id": tx_hash}
+
+        tx._process(
+            "algorand_pera", tx._algorand_prepare_confirmation_data(tx_hash, info)
+        )
+        self._algorand_finalize_checkout(tx, tx_hash)
+        return {
+            "success": True,
+            "state": tx.state,
             "tx_id": tx_hash,
-            "sender_address": sender_address,
+            "confirmed_round": info["confirmed-round"],
         }
-        tx.sudo()._process("algorand_pera", data)
 
+    @http.route(
+        "/payment/algorand_pera/notifications",
+        type="json",
+        auth="public",
+        methods=["POST"],
+        csrf=False,
+    )
+    def algorand_pera_notifications(self, notifications=None, **kwargs):
+        """Apply a batch of on-chain confirmations posted by an indexer or relay.
+
+        The request must carry the provider's notification token as
+        `Authorization: Bearer <token>`. The whole batch is applied in one
+        database transaction and the status of each item is returned.
+        """
+        auth_header = request.httprequest.headers.get("Authorization", "")
+        token = auth_header[7:] if auth_header.startswith("Bearer ") else None
+        provider = request.env["payment.provider"]._algorand_get_provider_from_token(
+            token
+        )
+        if not provider:
+            _logger.warning("[Algorand][notifications] Rejected unauthenticated batch")
+            raise Forbidden()
+
+        if not isinstance(notifications, list):
+            return {"error": True, "message": "notifications must be a list"}
+        max_size = int(
+            request.env["ir.config_parameter"]
+            .sudo()
+            .get_param("algorand_pera_payment.notification_batch_size", "1000")
+        )
+        if len(notifications) > max_size:
+            return {
+                "error": True,
+                "message": f"Batches are limited to {max_size} notifications",
+            }
+
+        results = (
+            request.env["payment.transaction"]
+            .sudo()
+            ._algorand_process_notification_batch(provider, notifications)
+        )
+        return {"success": True, "results": results}
+
+    def _algorand_finalize_checkout(self, tx, tx_hash):
+        """Monitor the transaction and confirm the session's sale order.
+
+        :param payment.transaction tx: The processed transaction.
+        :param str tx_hash: The on-chain transaction id.
+        :return: None
+        """
         # Register transaction for monitoring on /payment/status page
         # This stores the tx ID in session so the status page can display it
         from odoo.addons.payment.controllers.post_processing import (
@@ -181,22 +318,3 @@ class PeraPaymentController(http.Controller):
                     )
                 except Exception as e:
                     _logger.warning("[Algorand] Order confirmation failed: %s", e)
-
-        # Cart clearing is handled automatically by Odoo's website_sale
-        # module:
-        # - When order is confirmed (state changes from 'draft' to 'sale')
-        # - User navigates to /shop or /shop/cart
-        # - website_sale controller detects order.state != 'draft'
-        # - session['sale_order_id'] is set to None
-        # - Cart badge updates via page reload
-        #
-        # Manual cart clearing can cause issues:
-        # - Race conditions with multiple tabs/windows
-        # - Session synchronization problems
-        # - Interference with Odoo's built-in cart management
-
-        _logger.info(
-            "[Algorand][algorand_pera_process] "
-            "==================== SUCCESS ===================="
-        )
-        return {"success": True, "tx_id": tx_hash}
@@ -1,20 +1,27 @@
 # -*- coding: utf-8 -*-
 
+from odoo.tools import SQL
+
+from odoo.addons.algorand_pera_payment.tools import migration
+
+
 def migrate(cr, version):
     """Migrate existing payment transactions to use the new payment method."""
-    
+
     # Check if there are any existing payment transactions with the old method
-    cr.execute("""
-        SELECT id FROM payment_transaction 
-        WHERE payment_method_id IN (
-            SELECT id FROM payment_method 
-            WHERE code = 'algorand_pera' AND name != 'Algorand (Pera Wallet)'
-        )
-    """)
-    
-    old_transactions = cr.fetchall()
-    
-    if old_transactions:
+    # (stops at the first match instead of fetching every transaction id)
+    has_old_transactions = migration.has_rows(
+        cr,
+        "payment_transaction",
+        SQL("""
+            payment_method_id IN (
+                SELECT id FROM payment_method
+                WHERE code = 'algorand_pera' AND name != 'Algorand (Pera Wallet)'
+            )
+        """),
+    )
+
+    if has_old_transactions:
         # Update the payment method name for existing transactions
         cr.execute("""
             UPDATE payment_method 
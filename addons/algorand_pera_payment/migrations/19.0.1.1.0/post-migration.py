@@ -0,0 +1,80 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from odoo import SUPERUSER_ID, api
+from odoo.tools import SQL
+
+from odoo.addons.algorand_pera_payment.tools import migration
+
+
+def migrate(cr, version):
+    _backfill_network(cr)
+    _backfill_receipts(cr)
+
+
+def _backfill_network(cr):
+    """Backfill the network of Algorand transactions from their provider state.
+
+    Mirrors `payment.provider._algorand_effective_network`: enabled providers
+    run on mainnet, any other state on testnet.
+    """
+    migration.chunked_update(
+        cr,
+        "19.0.1.1.0_backfill_algorand_network",
+        "payment_transaction",
+        SQL("""
+            algorand_network = (
+                SELECT CASE WHEN p.state = 'enabled' THEN 'mainnet' ELSE 'testnet' END
+                FROM payment_provider p
+                WHERE p.id = payment_transaction.provider_id
+            )
+        """),
+        where=SQL("""
+            algorand_network IS NULL
+            AND provider_id IN (
+                SELECT id FROM payment_provider WHERE code = 'algorand_pera'
+            )
+        """),
+    )
+
+
+def _backfill_receipts(cr):
+    """Create the receipts of the Algorand payments confirmed before the
+    receipt ledger existed, so that exports and revenue summaries cover them.
+
+    The confirmation round and fee are unknown and left to 0; the confirmation
+    date is the last state change of the transaction.
+    """
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    Receipt = env["algorand.payment.receipt"]
+    for ids in migration.iter_id_chunks(
+        cr,
+        "19.0.1.1.0_backfill_algorand_receipts",
+        "payment_transaction",
+        where=SQL("""
+            state = 'done'
+            AND algorand_tx_id IS NOT NULL
+            AND provider_id IN (
+                SELECT id FROM payment_provider WHERE code = 'algorand_pera'
+            )
+            AND NOT EXISTS (
+                SELECT 1 FROM algorand_payment_receipt r
+                WHERE r.transaction_id = payment_transaction.id
+            )
+        """),
+        chunk_size=1000,
+    ):
+        txs = env["payment.transaction"].browse(ids)
+        Receipt._create_from_transactions(
+            txs,
+            {
+                tx.id: {
+                    "tx_id": tx.algorand_tx_id,
+                    "sender_address": tx.algorand_sender_address,
+                    "confirmed_date": tx.last_state_change,
+                }
+                for tx in txs
+            },
+        )
+        env.flush_all()
+        env.invalidate_all()
@@ -1,6 +1,10 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+from . import algorand_asset
+from . import algorand_node_health
+from . import algorand_payment_receipt
+from . import algorand_revenue_summary
 from . import payment_method
 from . import payment_provider
 from . import payment_transaction
@@ -0,0 +1,210 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import logging
+from datetime import timedelta
+
+from odoo import _, api, fields, models
+
+from .. import const
+from ..tools import algod
+from .algorand_payment_receipt import BigInteger
+
+_logger = logging.getLogger(__name__)
+
+METADATA_FETCH_TIMEOUT = 5
+
+
+class AlgorandAsset(models.Model):
+    """Registry of the Algorand Standard Assets (ASA) accepted as payment.
+
+    The on-chain metadata (decimals, unit name, clawback/freeze addresses) is
+    fetched once from algod and stored, then refreshed in the background when
+    older than the configured TTL. Checkout only reads the stored values.
+    """
+
+    _name = "algorand.asset"
+    _description = "Algorand Standard Asset"
+    _order = "network, unit_name, asset_id"
+    _rec_names_search = ["name", "unit_name", "asset_id"]
+
+    name = fields.Char(string="Asset Name")
+    asset_id = BigInteger(string="Asset ID", required=True)
+    network = fields.Selection(
+        selection=[("testnet", "Testnet"), ("mainnet", "Mainnet")],
+        required=True,
+        default="testnet",
+    )
+    currency_id = fields.Many2one(
+        comodel_name="res.currency",
+        string="Settled Currency",
+        help="The currency whose payments are settled in this asset, e.g. EUR "
+        "for EURC.",
+        required=True,
+    )
+    active = fields.Boolean(default=True)
+    unit_name = fields.Char(readonly=True)
+    decimals = fields.Integer(readonly=True)
+    clawback_address = fields.Char(readonly=True)
+    freeze_address = fields.Char(readonly=True)
+    default_frozen = fields.Boolean(readonly=True)
+    has_clawback = fields.Boolean(compute="_compute_has_clawback_freeze", store=True)
+    has_freeze = fields.Boolean(compute="_compute_has_clawback_freeze", store=True)
+    metadata_date = fields.Datetime(
+        string="Metadata Fetched On",
+        help="When the on-chain metadata was last fetched from algod. Assets "
+        "whose metadata was never fetched are not offered at checkout.",
+        readonly=True,
+    )
+    metadata_error = fields.Char(readonly=True)
+
+    _asset_network_uniq = models.Constraint(
+        "UNIQUE(asset_id, network)",
+        "This asset is already registered for this network.",
+    )
+
+    # === COMPUTE METHODS === #
+
+    @api.depends("clawback_address", "freeze_address")
+    def _compute_has_clawback_freeze(self):
+        for asset in self:
+            asset.has_clawback = bool(asset.clawback_address)
+            asset.has_freeze = bool(asset.freeze_address)
+
+    @api.depends("unit_name", "asset_id", "network")
+    def _compute_display_name(self):
+        for asset in self:
+            asset.display_name = "%s (%s, %s)" % (
+                asset.unit_name or asset.name or _("Unknown"),
+                asset.asset_id,
+                asset.network,
+            )
+
+    # === CRUD METHODS === #
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        assets = super().create(vals_list)
+        if assets.filtered(lambda a: not a.metadata_date):
+            # Fetched in the background rather than blocking the creation on
+            # the node
+            self.env.ref(
+                "algorand_pera_payment.cron_algorand_asset_refresh_metadata"
+            ).sudo()._trigger()
+        return assets
+
+    # === BUSINESS METHODS === #
+
+    @api.model
+    def _get_metadata_ttl(self):
+        """Return the maximum age of the stored metadata, as a timedelta."""
+        hours = (
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("algorand_pera_payment.asset_metadata_ttl_hours", "24")
+        )
+        return timedelta(hours=float(hours))
+
+    def _is_metadata_stale(self):
+        self.ensure_one()
+        return (
+            not self.metadata_date
+            or self.metadata_date < fields.Datetime.now() - self._get_metadata_ttl()
+        )
+
+    @api.model
+    def _get_nodes_by_network(self):
+        """Return the node URL and token to query for each network: the node of
+        an active Algorand provider on that network, else the public node.
+
+        :rtype: dict
+        """
+        nodes = {
+            network: (url, None) for network, url in const.ALGOD_URLS_BY_NETWORK.items()
+        }
+        providers = (
+            self.env["payment.provider"]
+            .sudo()
+            .search(
+                [("code", "=", "algorand_pera"), ("state", "!=", "disabled")],
+                order="sequence desc",
+            )
+        )
+        for provider in providers:
+            config = provider._algorand_get_config()
+            nodes[config["network"]] = (config["node_url"], config["node_token"])
+        return nodes
+
+    def _fetch_metadata(self):
+        """Fetch the on-chain parameters of the assets from algod and store them.
+
+        Failures are logged and stored on the asset; the previous metadata is
+        kept so that a transient node outage does not disable the asset.
+
+        :return: None
+        """
+        nodes = self._get_nodes_by_network()
+        for asset in self:
+            node_url, token = nodes[asset.network]
+            try:
+                params = algod.asset_info(
+                    node_url,
+                    asset.asset_id,
+                    token=token,
+                    timeout=METADATA_FETCH_TIMEOUT,
+                )["params"]
+            except algod.AlgodError as e:
+                _logger.warning(
+                    "[Algorand][asset] Failed to fetch metadata of ASA %s on %s: %s",
+                    asset.asset_id,
+                    asset.network,
+                    e,
+                )
+                asset.metadata_error = str(e)
+                continue
+            asset.write(
+                {
+                    "name": asset.name or params.get("name"),
+                    "unit_name": params.get("unit-name"),
+                    "decimals": params.get("decimals", 0),
+                    "clawback_address": params.get("clawback"),
+                    "freeze_address": params.get("freeze"),
+                    "default_frozen": params.get("default-frozen", False),
+                    "metadata_date": fields.Datetime.now(),
+                    "metadata_error": False,
+                }
+            )
+
+    @api.model
+    def _cron_refresh_metadata(self):
+        """Refresh the metadata of the assets older than the configured TTL."""
+        expiry_date = fields.Datetime.now() - self._get_metadata_ttl()
+        stale_assets = self.search(
+            ["|", ("metadata_date", "=", False), ("metadata_date", "<", expiry_date)]
+        )
+        stale_assets._fetch_metadata()
+
+    # === ACTIONS === #
+
+    def action_fetch_metadata(self):
+        self._fetch_metadata()
+        failed_assets = self.filtered("metadata_error")
+        if failed_assets:
+            message = _("Could not fetch the metadata of %(assets)s: %(error)s") % {
+                "assets": ", ".join(failed_assets.mapped("display_name")),
+                "error": failed_assets[0].metadata_error,
+            }
+            level = "warning"
+        else:
+            message = _("Asset metadata refreshed.")
+            level = "success"
+        return {
+            "type": "ir.actions.client",
+            "tag": "display_notification",
+            "params": {
+                "message": message,
+                "type": level,
+                "sticky": False,
+                "next": {"type": "ir.actions.client", "tag": "soft_reload"},
+            },
+        }
@@ -0,0 +1,156 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import logging
+import time
+from datetime import timedelta
+
+from dateutil.relativedelta import relativedelta
+
+from odoo import api, fields, models
+
+from ..tools import algod
+from .algorand_payment_receipt import BigInteger
+
+_logger = logging.getLogger(__name__)
+
+
+class AlgorandNodeHealth(models.Model):
+    """Last known health of an algod node, as recorded by the background probe.
+
+    Admin actions and checkout read these rows instead of calling the node
+    themselves.
+    """
+
+    _name = "algorand.node.health"
+    _description = "Algorand Node Health"
+    _order = "node_url"
+    _rec_name = "node_url"
+
+    node_url = fields.Char(string="Node URL", required=True, readonly=True)
+    is_healthy = fields.Boolean(readonly=True)
+    latency_ms = fields.Integer(string="Latency (ms)", readonly=True)
+    last_round = BigInteger(readonly=True)
+    last_error = fields.Char(readonly=True)
+    consecutive_failures = fields.Integer(readonly=True)
+    checked_date = fields.Datetime(string="Checked On", readonly=True)
+
+    _node_url_uniq = models.Constraint(
+        "UNIQUE(node_url)", "The health of a node is only recorded once."
+    )
+
+    # === BUSINESS METHODS === #
+
+    @api.model
+    def _get_probe_timeout(self):
+        """Return the timeout of a probe, in seconds."""
+        return float(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("algorand_pera_payment.node_probe_timeout", "5")
+        )
+
+    @api.model
+    def _get_unhealthy_threshold(self):
+        """Return the number of consecutive failed probes after which a node is
+        considered down."""
+        return int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("algorand_pera_payment.node_unhealthy_threshold", "3")
+        )
+
+    @api.model
+    def _get_staleness_limit(self):
+        """Return the age past which a probe result is disregarded: ten
+        intervals of the probe cron."""
+        cron = self.env.ref(
+            "algorand_pera_payment.cron_algorand_node_probe", raise_if_not_found=False
+        )
+        if not cron:
+            return timedelta(minutes=20)
+        cron = cron.sudo()
+        return relativedelta(**{cron.interval_type: cron.interval_number * 10})
+
+    @api.model
+    def _get_for_url(self, node_url):
+        """Return the recorded health of `node_url`, if any."""
+        return self.sudo().search([("node_url", "=", node_url)], limit=1)
+
+    def _is_down(self):
+        """Return whether the node failed enough recent probes to be skipped.
+
+        A result older than ten probe intervals is disregarded, so that a
+        stopped cron cannot hide a provider forever.
+        """
+        self.ensure_one()
+        oldest = fields.Datetime.now() - self._get_staleness_limit()
+        return (
+            not self.is_healthy
+            and self.consecutive_failures >= self._get_unhealthy_threshold()
+            and self.checked_date
+            and self.checked_date > oldest
+        )
+
+    @api.model
+    def _probe(self, node_urls, tokens=None):
+        """Query the status of each node and record the result.
+
+        The nodes are queried through the pooled connections of `tools.algod`
+        shared with the relay.
+
+        :param list node_urls: The URLs of the nodes to probe.
+        :param dict tokens: The API token of the nodes requiring one, keyed by
+            URL.
+        :return: The updated health records.
+        :rtype: algorand.node.health
+        """
+        timeout = self._get_probe_timeout()
+        healths = self.browse()
+        for node_url in node_urls:
+            health = self._get_for_url(node_url) or self.sudo().create(
+                {"node_url": node_url}
+            )
+            start = time.monotonic()
+            try:
+                status = algod.status(
+                    node_url, token=(tokens or {}).get(node_url), timeout=timeout
+                )
+            except (algod.AlgodError, ValueError) as e:
+                health.write(
+                    {
+                        "is_healthy": False,
+                        "latency_ms": int((time.monotonic() - start) * 1000),
+                        "last_error": str(e)[:500],
+                        "consecutive_failures": health.consecutive_failures + 1,
+                        "checked_date": fields.Datetime.now(),
+                    }
+                )
+                _logger.warning("[Algorand][node] Probe of %s failed: %s", node_url, e)
+            else:
+                health.write(
+                    {
+                        "is_healthy": True,
+                        "latency_ms": int((time.monotonic() - start) * 1000),
+                        "last_round": status.get("last-round", 0),
+                        "last_error": False,
+                        "consecutive_failures": 0,
+                        "checked_date": fields.Datetime.now(),
+                    }
+                )
+            healths |= health
+        return healths
+
+    @api.model
+    def _cron_probe_nodes(self):
+        """Probe the nodes of all active Algorand providers."""
+        providers = (
+            self.env["payment.provider"]
+            .sudo()
+            .search([("code", "=", "algorand_pera"), ("state", "!=", "disabled")])
+        )
+        tokens = {}
+        for provider in providers:
+            config = provider._algorand_get_config()
+            tokens.setdefault(config["node_url"], config["node_token"])
+        self._probe(sorted(tokens), tokens=tokens)
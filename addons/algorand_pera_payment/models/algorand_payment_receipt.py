@@ -0,0 +1,191 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import hashlib
+import logging
+
+from odoo import api, fields, models
+from odoo.tools.float_utils import float_round
+
+_logger = logging.getLogger(__name__)
+
+
+class BigInteger(fields.Integer):
+    """Integer field stored in an `int8` column.
+
+    On-chain amounts are expressed in microunits and overflow the `int4`
+    column of a regular Integer field past ~2147 ALGO/USDC.
+    """
+
+    _column_type = ("int8", "int8")
+
+
+class AlgorandPaymentReceipt(models.Model):
+    """Compact on-chain receipt of a confirmed Algorand payment.
+
+    One row per confirmed transfer, holding integer microunit amounts so that
+    audits and analytics can run on indexed integer columns instead of
+    parsing the Char fields of `payment.transaction`.
+    """
+
+    _name = "algorand.payment.receipt"
+    _description = "Algorand Payment Receipt"
+    _order = "confirmed_round desc, id desc"
+    _rec_name = "tx_hash"
+
+    transaction_id = fields.Many2one(
+        comodel_name="payment.transaction",
+        string="Payment Transaction",
+        required=True,
+        index=True,
+        ondelete="cascade",
+    )
+    company_id = fields.Many2one(
+        comodel_name="res.company",
+        related="transaction_id.company_id",
+        store=True,
+        index=True,
+    )
+    tx_hash = fields.Char(
+        string="Transaction Hash",
+        required=True,
+        index=True,
+        readonly=True,
+    )
+    network = fields.Selection(
+        selection=[("testnet", "Testnet"), ("mainnet", "Mainnet")],
+        required=True,
+        readonly=True,
+    )
+    sender_address = fields.Char(readonly=True)
+    receiver_address = fields.Char(readonly=True)
+    asset_id = BigInteger(
+        string="Asset ID",
+        help="The ASA ID of the transferred asset, 0 for ALGO.",
+        readonly=True,
+    )
+    amount_micro = BigInteger(
+        string="Amount (microunits)",
+        help="The transferred amount in the asset's smallest unit.",
+        readonly=True,
+    )
+    fee_micro = BigInteger(
+        string="Fee (microAlgos)",
+        readonly=True,
+    )
+    confirmed_round = BigInteger(
+        index=True,
+        readonly=True,
+    )
+    note_hash = fields.Char(
+        help="SHA-256 hex digest of the transaction note.",
+        readonly=True,
+    )
+    amount = fields.Monetary(readonly=True)
+    currency_id = fields.Many2one(
+        comodel_name="res.currency",
+        required=True,
+        readonly=True,
+    )
+    confirmed_date = fields.Datetime(
+        default=fields.Datetime.now,
+        required=True,
+        index=True,
+        readonly=True,
+    )
+
+    _tx_hash_network_uniq = models.Constraint(
+        "UNIQUE(tx_hash, network)",
+        "An on-chain transaction can only be receipted once per network.",
+    )
+    _network_round_idx = models.Index("(network, confirmed_round)")
+    _confirmed_date_id_idx = models.Index("(confirmed_date, id)")
+
+    # === CRUD METHODS === #
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        receipts = super().create(vals_list)
+        self.env["algorand.revenue.summary"].sudo()._add_receipts(receipts)
+        return receipts
+
+    # === BUSINESS METHODS === #
+
+    @api.model
+    def _to_microunits(self, amount, decimals):
+        """Convert an amount in major units into integer microunits."""
+        return int(float_round(amount * 10**decimals, precision_digits=0))
+
+    @api.model
+    def _hash_note(self, note):
+        """Return the SHA-256 hex digest of a transaction note.
+
+        :param note: The raw note, as bytes or str.
+        :return: The hex digest, or False when there is no note.
+        :rtype: str | bool
+        """
+        if not note:
+            return False
+        if isinstance(note, str):
+            note = note.encode()
+        return hashlib.sha256(note).hexdigest()
+
+    @api.model
+    def _prepare_receipt_values(self, tx, onchain_data):
+        """Return the values to create the receipt of a confirmed transaction.
+
+        :param payment.transaction tx: The confirmed Algorand transaction.
+        :param dict onchain_data: The on-chain data of the transfer, with keys
+            `tx_id`, and optionally `sender_address`, `confirmed_round`,
+            `confirmed_date`, `fee` and `note`.
+        :return: The receipt values.
+        :rtype: dict
+        """
+        provider = tx.provider_id
+        asset = provider._algorand_get_payment_asset(tx.currency_id)
+        return {
+            "transaction_id": tx.id,
+            "tx_hash": onchain_data["tx_id"],
+            "network": tx.algorand_network or provider._algorand_effective_network(),
+            "sender_address": onchain_data.get("sender_address")
+            or tx.algorand_sender_address,
+            "receiver_address": provider._algorand_get_config()["merchant_address"],
+            "asset_id": asset["asset_id"],
+            "amount_micro": self._to_microunits(tx.amount, asset["decimals"]),
+            "fee_micro": int(onchain_data.get("fee") or 0),
+            "confirmed_round": int(onchain_data.get("confirmed_round") or 0),
+            "note_hash": self._hash_note(onchain_data.get("note")),
+            "amount": tx.amount,
+            "currency_id": tx.currency_id.id,
+            "confirmed_date": onchain_data.get("confirmed_date")
+            or fields.Datetime.now(),
+        }
+
+    @api.model
+    def _create_from_transactions(self, txs, onchain_data_by_tx):
+        """Create the receipts of confirmed transactions, skipping known ones.
+
+        :param payment.transaction txs: The confirmed Algorand transactions.
+        :param dict onchain_data_by_tx: The on-chain data of each transaction,
+            keyed by transaction id. See `_prepare_receipt_values`.
+        :return: The created receipts.
+        :rtype: algorand.payment.receipt
+        """
+        txs = txs.filtered(lambda tx: onchain_data_by_tx.get(tx.id, {}).get("tx_id"))
+        if not txs:
+            return self.browse()
+
+        hashes = [onchain_data_by_tx[tx.id]["tx_id"] for tx in txs]
+        known_hashes = set(
+            self.sudo().search([("tx_hash", "in", hashes)]).mapped("tx_hash")
+        )
+        vals_list = []
+        for tx in txs:
+            onchain_data = onchain_data_by_tx[tx.id]
+            if onchain_data["tx_id"] in known_hashes:
+                continue
+            known_hashes.add(onchain_data["tx_id"])
+            vals_list.append(self._prepare_receipt_values(tx, onchain_data))
+        receipts = self.sudo().create(vals_list)
+        _logger.info("[Algorand][receipt] Created %s receipt(s)", len(receipts))
+        return receipts
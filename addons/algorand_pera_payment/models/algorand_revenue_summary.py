@@ -0,0 +1,164 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+import logging
+from collections import defaultdict
+
+from odoo import _, api, fields, models
+from odoo.exceptions import AccessError
+from odoo.tools import SQL
+
+from .algorand_payment_receipt import BigInteger
+
+_logger = logging.getLogger(__name__)
+
+
+class AlgorandRevenueSummary(models.Model):
+    """Daily Algorand revenue, aggregated from the payment receipts.
+
+    Rows are keyed by day, network, asset, currency and company. They are
+    incremented as receipts are created and can be rebuilt from scratch with
+    `_rebuild`, so reporting never scans `payment_transaction`.
+    """
+
+    _name = "algorand.revenue.summary"
+    _description = "Algorand Revenue Summary"
+    _order = "date desc, network, asset_id"
+
+    date = fields.Date(required=True, readonly=True, index=True)
+    network = fields.Selection(
+        selection=[("testnet", "Testnet"), ("mainnet", "Mainnet")],
+        required=True,
+        readonly=True,
+    )
+    asset_id = BigInteger(
+        string="Asset ID",
+        help="The ASA ID of the received asset, 0 for ALGO.",
+        required=True,
+        readonly=True,
+    )
+    currency_id = fields.Many2one(
+        comodel_name="res.currency", required=True, readonly=True
+    )
+    company_id = fields.Many2one(
+        comodel_name="res.company", required=True, readonly=True
+    )
+    payment_count = fields.Integer(string="Payments", readonly=True)
+    amount = fields.Monetary(readonly=True)
+    amount_micro = BigInteger(string="Amount (microunits)", readonly=True)
+    fee_micro = BigInteger(string="Fees (microAlgos)", readonly=True)
+
+    _summary_key_uniq = models.Constraint(
+        "UNIQUE(date, network, asset_id, currency_id, company_id)",
+        "Only one summary row may exist per day, network, asset, currency and "
+        "company.",
+    )
+
+    # === BUSINESS METHODS === #
+
+    @api.model
+    def _add_receipts(self, receipts):
+        """Increment the summary rows with the given, newly created receipts.
+
+        :param algorand.payment.receipt receipts: The receipts to account for.
+        :return: None
+        """
+        totals = defaultdict(lambda: [0, 0.0, 0, 0])
+        for receipt in receipts:
+            key = (
+                fields.Date.to_date(receipt.confirmed_date),
+                receipt.network,
+                receipt.asset_id,
+                receipt.currency_id.id,
+                receipt.company_id.id,
+            )
+            totals[key][0] += 1
+            totals[key][1] += receipt.amount
+            totals[key][2] += receipt.amount_micro
+            totals[key][3] += receipt.fee_micro
+        if not totals:
+            return
+
+        self.flush_model()
+        for key, (count, amount, amount_micro, fee_micro) in totals.items():
+            self.env.cr.execute(
+                SQL(
+                    """
+                    INSERT INTO algorand_revenue_summary (
+                        date, network, asset_id, currency_id, company_id,
+                        payment_count, amount, amount_micro, fee_micro,
+                        create_uid, create_date, write_uid, write_date
+                    )
+                    VALUES (
+                        %s, %s, %s, %s, %s, %s, %s, %s, %s,
+                        %s, NOW() AT TIME ZONE 'UTC', %s, NOW() AT TIME ZONE 'UTC'
+                    )
+                    ON CONFLICT (date, network, asset_id, currency_id, company_id)
+                    DO UPDATE SET
+                        payment_count = algorand_revenue_summary.payment_count
+                            + EXCLUDED.payment_count,
+                        amount = algorand_revenue_summary.amount + EXCLUDED.amount,
+                        amount_micro = algorand_revenue_summary.amount_micro
+                            + EXCLUDED.amount_micro,
+                        fee_micro = algorand_revenue_summary.fee_micro
+                            + EXCLUDED.fee_micro,
+                        write_uid = EXCLUDED.write_uid,
+                        write_date = EXCLUDED.write_date
+                    """,
+                    *key,
+                    count,
+                    amount,
+                    amount_micro,
+                    fee_micro,
+                    self.env.uid,
+                    self.env.uid,
+                )
+            )
+        self.invalidate_model()
+
+    @api.model
+    def _rebuild(self):
+        """Recompute the whole summary table from the payment receipts.
+
+        :return: The number of summary rows.
+        :rtype: int
+        """
+        self.env["algorand.payment.receipt"].flush_model()
+        self.env.cr.execute(SQL("DELETE FROM algorand_revenue_summary"))
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO algorand_revenue_summary (
+                    date, network, asset_id, currency_id, company_id,
+                    payment_count, amount, amount_micro, fee_micro,
+                    create_uid, create_date, write_uid, write_date
+                )
+                SELECT
+                    confirmed_date::date, network,
+                    COALESCE(asset_id, 0), currency_id, company_id,
+                    COUNT(*), SUM(amount), SUM(amount_micro), SUM(fee_micro),
+                    %s, NOW() AT TIME ZONE 'UTC', %s, NOW() AT TIME ZONE 'UTC'
+                FROM algorand_payment_receipt
+                WHERE company_id IS NOT NULL
+                GROUP BY 1, 2, 3, 4, 5
+                """,
+                self.env.uid,
+                self.env.uid,
+            )
+        )
+        row_count = self.env.cr.rowcount
+        self.invalidate_model()
+        _logger.info("[Algorand][summary] Rebuilt %s summary row(s)", row_count)
+        return row_count
+
+    # === ACTIONS === #
+
+    def action_rebuild(self):
+        """Rebuild the summary table and reload the view.
+
+        :raise AccessError: If the user is not an administrator.
+        """
+        if not self.env.is_system():
+            raise AccessError(_("Only administrators can rebuild the revenue summary."))
+        self.sudo()._rebuild()
+        return {"type": "ir.actions.client", "tag": "reload"}
@@ -1,16 +1,30 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+import hmac
 import json
 import logging
 
 from odoo import _, api, fields, models
 from odoo.exceptions import ValidationError
+from odoo.tools import frozendict, ormcache
+
+from odoo.addons.payment import utils as payment_utils
 
 from .. import const
+from ..tools import profiling
 
 _logger = logging.getLogger(__name__)
 
+# Fields whose change invalidates the cached configuration of the providers
+ALGORAND_CONFIG_FIELDS = {
+    "code",
+    "state",
+    "algorand_merchant_address",
+    "algorand_node_url",
+    "algorand_node_token",
+}
+
 
 class PaymentProvider(models.Model):
     _inherit = "payment.provider"
@@ -20,7 +34,6 @@ class PaymentProvider(models.Model):
         ondelete={"algorand_pera": "set default"},
     )
 
-
     def _algorand_effective_network(self) -> str:
         """Return the effective network derived from provider state.
 
@@ -43,11 +56,7 @@ class PaymentProvider(models.Model):
             if provider.code != "algorand_pera":
                 continue
             network = provider._algorand_effective_network()
-            provider.algorand_node_url = (
-                "https://mainnet-api.algonode.cloud"
-                if network == "mainnet"
-                else "https://testnet-api.algonode.cloud"
-            )
+            provider.algorand_node_url = const.ALGOD_URLS_BY_NETWORK[network]
 
     algorand_network = fields.Selection(
         [("testnet", "Testnet"), ("mainnet", "Mainnet")],
@@ -62,6 +71,29 @@ class PaymentProvider(models.Model):
         help="The Algorand node URL for transaction broadcasting",
     )
 
+    algorand_node_token = fields.Char(
+        string="Algorand Node Token",
+        help="The API token of the node, if it requires one.",
+        groups="base.group_system",
+        copy=False,
+    )
+
+    algorand_asset_ids = fields.Many2many(
+        comodel_name="algorand.asset",
+        string="Accepted Assets",
+        help="The Algorand Standard Assets accepted in addition to ALGO. Payments "
+        "in an asset's settled currency are requested in that asset. USD falls "
+        "back to USDC when no asset is configured for it.",
+    )
+
+    algorand_notification_token = fields.Char(
+        string="Notification Token",
+        help="Bearer token authenticating batches of confirmations posted to "
+        "/payment/algorand_pera/notifications by an indexer or relay.",
+        groups="base.group_system",
+        copy=False,
+    )
+
     # Add logo field for provider
     image_128 = fields.Image(
         string="Logo",
@@ -73,14 +105,61 @@ class PaymentProvider(models.Model):
     # Note: No provider-specific accounting/journal fields
     # Odoo's standard payment flow handles journal assignment automatically
 
+    # === CRUD METHODS === #
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        providers = super().create(vals_list)
+        if "algorand_pera" in providers.mapped("code"):
+            self.env.registry.clear_cache()
+        return providers
+
+    def write(self, vals):
+        is_algorand = "algorand_pera" in self.mapped("code")
+        res = super().write(vals)
+        if is_algorand and ALGORAND_CONFIG_FIELDS & vals.keys():
+            self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        is_algorand = "algorand_pera" in self.mapped("code")
+        res = super().unlink()
+        if is_algorand:
+            self.env.registry.clear_cache()
+        return res
+
     def _get_supported_currencies(self, *args, **kwargs):
         """Override to return the supported currencies."""
         if self.code == "algorand_pera":
-            # Algorand supports USD (via USDC stablecoin)
+            # Algorand supports USD (via USDC stablecoin) and the currencies
+            # settled by the configured assets.
             # Return USD currency explicitly to ensure it's always available
-            return self.env["res.currency"].search([("name", "=", "USD")])
+            return self.env["res.currency"].search(
+                [
+                    "|",
+                    ("name", "=", "USD"),
+                    ("id", "in", self.algorand_asset_ids.currency_id.ids),
+                ]
+            )
         return super()._get_supported_currencies(*args, **kwargs)
 
+    @api.model
+    def _get_compatible_providers(self, *args, report=None, **kwargs):
+        """Override to skip Algorand providers whose node is known to be down."""
+        providers = super()._get_compatible_providers(*args, report=report, **kwargs)
+        unavailable_providers = providers.filtered(
+            lambda p: p.code == "algorand_pera" and p._algorand_is_node_down()
+        )
+        if unavailable_providers:
+            providers -= unavailable_providers
+            payment_utils.add_to_report(
+                report,
+                unavailable_providers,
+                available=False,
+                reason=_("the Algorand node is unreachable"),
+            )
+        return providers
+
     def _get_supported_flows(self):
         """Override to return the supported payment flows."""
         if self.code == "algorand_pera":
@@ -94,6 +173,135 @@ class PaymentProvider(models.Model):
             return super()._get_default_payment_method_codes()
         return const.DEFAULT_PAYMENT_METHOD_CODES
 
+    # === CONFIGURATION === #
+
+    @ormcache("self.id")
+    def _algorand_get_config(self):
+        """Return the effective configuration of the provider.
+
+        The provider's own values win; the global settings
+        (`algorand.merchant_address`, `algorand.algod_url` and
+        `algorand.algod_token` parameters) are the fallback, then the public
+        node of the network. The result is cached per worker until a provider
+        or a system parameter is written.
+
+        Note: `self.ensure_one()`
+
+        :return: The `provider_id`, `network`, `merchant_address`, `node_url`
+            and `node_token`.
+        :rtype: frozendict
+        """
+        self.ensure_one()
+        provider = self.sudo()
+        icp = self.env["ir.config_parameter"].sudo()
+        network = provider._algorand_effective_network()
+        return frozendict(
+            provider_id=provider.id,
+            network=network,
+            merchant_address=(
+                provider.algorand_merchant_address
+                or icp.get_param("algorand.merchant_address")
+                or ""
+            ).strip(),
+            node_url=provider.algorand_node_url
+            or icp.get_param("algorand.algod_url")
+            or const.ALGOD_URLS_BY_NETWORK[network],
+            node_token=provider.algorand_node_token
+            or icp.get_param("algorand.algod_token")
+            or None,
+        )
+
+    @api.model
+    def _algorand_get_provider_from_token(self, token):
+        """Return the Algorand provider authenticated by a notification token.
+
+        :param str token: The bearer token of the request.
+        :return: The matching provider, or an empty recordset.
+        :rtype: payment.provider
+        """
+        if not token:
+            return self.browse()
+        providers = self.sudo().search(
+            [
+                ("code", "=", "algorand_pera"),
+                ("algorand_notification_token", "!=", False),
+            ]
+        )
+        for provider in providers:
+            if hmac.compare_digest(
+                provider.algorand_notification_token.encode(), token.encode()
+            ):
+                return provider
+        return self.browse()
+
+    def _algorand_is_node_down(self):
+        """Return whether the background probe found the node to be down.
+
+        Note: `self.ensure_one()`
+        """
+        self.ensure_one()
+        health = self.env["algorand.node.health"]._get_for_url(
+            self._algorand_get_config()["node_url"]
+        )
+        return bool(health and health._is_down())
+
+    def _algorand_node_healthy_state(self):
+        """Return the last probed health of the node: True, False, or None when
+        it was never probed.
+
+        Note: `self.ensure_one()`
+        """
+        self.ensure_one()
+        health = self.env["algorand.node.health"]._get_for_url(
+            self._algorand_get_config()["node_url"]
+        )
+        return health.is_healthy if health else None
+
+    def _algorand_get_payment_asset(self, currency):
+        """Return the on-chain asset used to settle payments in `currency`.
+
+        The configured assets of the current network are looked up first, by
+        settled currency, using their stored metadata only. USD otherwise falls
+        back to USDC (ASA); any other currency is paid in ALGO.
+
+        Note: `self.ensure_one()`
+
+        :param res.currency currency: The currency of the transaction.
+        :return: The asset values: `asset_id` (0 for ALGO), `decimals`,
+            `display_name` and `is_asa`.
+        :rtype: dict
+        """
+        self.ensure_one()
+        network = self._algorand_effective_network()
+        asset = self.algorand_asset_ids.filtered(
+            lambda a: a.network == network
+            and a.currency_id == currency
+            and a.metadata_date
+        )[:1]
+        if asset:
+            return {
+                "asset_id": asset.asset_id,
+                "decimals": asset.decimals,
+                "display_name": asset.unit_name or asset.name,
+                "is_asa": True,
+            }
+        if currency and currency.name == "USD":
+            asset_id = const.USDC_ASA_IDS_BY_NETWORK.get(network)
+            if asset_id:
+                return {
+                    "asset_id": asset_id,
+                    "decimals": const.USDC_DECIMALS,
+                    "display_name": "USDC",
+                    "is_asa": True,
+                }
+        return {
+            "asset_id": 0,
+            "decimals": const.ALGO_DECIMALS,
+            "display_name": currency.name if currency else "ALGO",
+            "is_asa": False,
+        }
+
+    @profiling.profiled("payment.provider._algorand_get_inline_form_values")
     def _algorand_get_inline_form_values(
         self,
         amount,
@@ -122,19 +330,8 @@ class PaymentProvider(models.Model):
         """
         self.ensure_one()
 
-        # Decide if we should use USDC ASA (when user currency is USD)
-        use_usdc = bool(currency and currency.name == "USD")
-        usdc_asset_id = (
-            const.USDC_ASA_IDS_BY_NETWORK.get(self._algorand_effective_network())
-            if use_usdc
-            else None
-        )
-        currency_display_name = (
-            "USDC" if use_usdc else (currency.name if currency else "ALGO")
-        )
-
-        # Use provider-level merchant address (no method-level override)
-        merchant_address = self.algorand_merchant_address
+        asset = self._algorand_get_payment_asset(currency)
+        config = self._algorand_get_config()
 
         # Try to include a recent pending transaction id for this
         # partner/provider to help finalize
@@ -161,18 +358,19 @@ class PaymentProvider(models.Model):
 
         inline_form_values = {
             "tx_id": tx_id_val,
-            "merchant_address": merchant_address,
+            "merchant_address": config["merchant_address"],
             "amount": amount,
             "currency_name": currency.name if currency else "ALGO",
-            "currency_display_name": currency_display_name,
+            "currency_display_name": asset["display_name"],
             "partner_id": partner_id,
             "is_validation": is_validation,
-            "network": self._algorand_effective_network(),
-            "node_url": self.algorand_node_url,
+            "network": config["network"],
+            "node_url": config["node_url"],
+            "node_healthy": self._algorand_node_healthy_state(),
             "payment_methods_mapping": const.PAYMENT_METHODS_MAPPING,
-            "is_asa": use_usdc,
-            "asset_id": usdc_asset_id,
-            "asset_decimals": const.USDC_DECIMALS if use_usdc else 6,
+            "is_asa": asset["is_asa"],
+            "asset_id": asset["asset_id"] or None,
+            "asset_decimals": asset["decimals"],
         }
 
         return json.dumps(inline_form_values)
@@ -223,25 +421,27 @@ class PaymentProvider(models.Model):
         if self.code != "algorand_pera":
             return True
 
-        if not self.algorand_merchant_address:
+        config = self._algorand_get_config()
+        merchant_address = config["merchant_address"]
+        if not merchant_address:
             return False
 
         try:
             from algosdk.v2client import algod
 
             # Get USDC asset ID for current network
-            usdc_asset_id = const.USDC_ASA_IDS_BY_NETWORK.get(
-                self._algorand_effective_network()
-            )
+            usdc_asset_id = const.USDC_ASA_IDS_BY_NETWORK.get(config["network"])
             if not usdc_asset_id:
                 _logger.warning(
-                    "No USDC asset ID configured for network %s", self.algorand_network
+                    "No USDC asset ID configured for network %s", config["network"]
                 )
                 return False
 
             # Query blockchain for account info
-            algod_client = algod.AlgodClient("", self.algorand_node_url)
-            account_info = algod_client.account_info(self.algorand_merchant_address)
+            algod_client = algod.AlgodClient(
+                config["node_token"] or "", config["node_url"]
+            )
+            account_info = algod_client.account_info(merchant_address)
 
             # Check if account is opted-in to USDC
             assets = account_info.get("assets", [])
@@ -250,17 +450,17 @@ class PaymentProvider(models.Model):
                 if asset_id == usdc_asset_id:
                     _logger.info(
                         "Merchant address %s is opted-in to USDC (asset %s) on %s",
-                        self.algorand_merchant_address[:10] + "...",
+                        merchant_address[:10] + "...",
                         usdc_asset_id,
-                        self._algorand_effective_network(),
+                        config["network"],
                     )
                     return True
 
             _logger.warning(
                 "Merchant address %s is NOT opted-in to USDC (asset %s) on %s",
-                self.algorand_merchant_address[:10] + "...",
+                merchant_address[:10] + "...",
                 usdc_asset_id,
-                self._algorand_effective_network(),
+                config["network"],
             )
             return False
 
@@ -270,11 +470,7 @@ class PaymentProvider(models.Model):
         except Exception as e:
             _logger.error(
                 "Failed to check USDC opt-in for address %s: %s",
-                (
-                    self.algorand_merchant_address[:10] + "..."
-                    if self.algorand_merchant_address
-                    else "None"
-                ),
+                merchant_address[:10] + "...",
                 str(e),
             )
             return False
@@ -282,23 +478,44 @@ class PaymentProvider(models.Model):
     # === ADMIN ACTIONS === #
 
     def action_algorand_verify_node(self):
+        """Display the last health of the node recorded by the background probe.
+
+        The node is not queried here; when no probe result exists yet, the
+        probe cron is triggered so that the result is available shortly.
+        """
         self.ensure_one()
         if self.code != "algorand_pera":
             return {"type": "ir.actions.act_window_close"}
-        url = self.algorand_node_url or "https://testnet-api.algonode.cloud"
-        message = f"Node URL configured: {url}"
-        level = "info"
-        try:
-            # Try a lightweight status call if sdk is available
-            from algosdk.v2client import algod  # type: ignore
-
-            client = algod.AlgodClient("", url)
-            _ = client.status()  # may raise
-            message = f"Algorand node reachable: {url}"
+        url = self._algorand_get_config()["node_url"]
+        health = self.env["algorand.node.health"]._get_for_url(url)
+        if not health:
+            self.env.ref(
+                "algorand_pera_payment.cron_algorand_node_probe"
+            ).sudo()._trigger()
+            message = _(
+                "Node URL configured: %s. It has not been probed yet; check again "
+                "in a minute.",
+                url,
+            )
+            level = "info"
+        elif health.is_healthy:
+            message = _(
+                "Algorand node reachable: %(url)s (round %(round)s, %(latency)s ms, "
+                "checked %(date)s)",
+                url=url,
+                round=health.last_round,
+                latency=health.latency_ms,
+                date=health.checked_date,
+            )
             level = "success"
-        except Exception as e:  # pragma: no cover
+        else:
+            message = _(
+                "Could not reach Algorand node: %(url)s (%(error)s, checked %(date)s)",
+                url=url,
+                error=health.last_error,
+                date=health.checked_date,
+            )
             level = "warning"
-            message = f"Could not reach Algorand node: {url} ({e})"
         return {
             "type": "ir.actions.client",
             "tag": "display_notification",
@@ -316,7 +533,7 @@ class PaymentProvider(models.Model):
         if self.code != "algorand_pera":
             return {"type": "ir.actions.act_window_close"}
 
-        if not self.algorand_merchant_address:
+        if not self._algorand_get_config()["merchant_address"]:
             return {
                 "type": "ir.actions.client",
                 "tag": "display_notification",
@@ -1,9 +1,17 @@
 # Copyright 2025 Odoo Community Association (OCA)
 # License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
 
+import base64
+import json
 import logging
+from datetime import timedelta
 
-from odoo import api, fields, models
+from odoo import Command, _, api, fields, models
+from odoo.exceptions import ValidationError
+from odoo.tools import SQL, str2bool
+
+from .. import const
+from ..tools import algod, profiling
 
 _logger = logging.getLogger(__name__)
 
@@ -30,6 +38,18 @@ class PaymentTransaction(models.Model):
         help="Network on which the Algorand payment was performed",
     )
 
+    algorand_last_valid_round = fields.Integer(
+        string="Algorand Last Valid Round",
+        help="The last round in which the relayed transfer can be committed",
+    )
+
+    algorand_receipt_ids = fields.One2many(
+        comodel_name="algorand.payment.receipt",
+        inverse_name="transaction_id",
+        string="Algorand Receipts",
+        readonly=True,
+    )
+
     def _get_specific_processing_values(self, processing_values):
         """Override of payment to return Algorand-specific processing values.
 
@@ -46,12 +66,644 @@ class PaymentTransaction(models.Model):
         # For Algorand Pera Wallet, return processing values for inline form
         return {
             "tx_id": self.id,
-            "merchant_address": self.provider_id.algorand_merchant_address,
+            "merchant_address": self.provider_id._algorand_get_config()[
+                "merchant_address"
+            ],
             "amount_algo": self.amount,
             "currency": self.currency_id.name,
             "order_id": self.reference,
         }
 
+    # === Signed Transaction Relay === #
+
+    def _algorand_decode_signed_transaction(self, signed_txn_b64):
+        """Decode a base64, msgpack-encoded signed transaction.
+
+        :param str signed_txn_b64: The signed transaction sent by the frontend.
+        :return: The decoded signed transaction.
+        :rtype: algosdk.transaction.SignedTransaction
+        :raise ValidationError: If the payload is not a signed transaction.
+        """
+        from algosdk import encoding
+        from algosdk.transaction import SignedTransaction
+
+        try:
+            stxn = encoding.msgpack_decode(signed_txn_b64)
+        except Exception as e:
+            raise ValidationError(_("Malformed signed transaction.")) from e
+        if not isinstance(stxn, SignedTransaction):
+            raise ValidationError(_("The payload is not a signed transaction."))
+        return stxn
+
+    def _algorand_check_signed_transaction(self, stxn):
+        """Check that a signed transaction pays this transaction in full.
+
+        The receiver, asset, amount and network of the on-chain transfer must
+        match the merchant address, the asset resolved for the transaction's
+        currency and its amount, and its note must name this transaction, so
+        that a transfer seen in the pool cannot be replayed for another order.
+        Once a transfer was relayed, only that same transfer is accepted again,
+        and a transfer relayed for another transaction is never accepted.
+
+        Note: `self.ensure_one()`
+
+        :param algosdk.transaction.SignedTransaction stxn: The signed transfer.
+        :return: None
+        :raise ValidationError: If the transfer does not match the transaction.
+        """
+        from algosdk.transaction import AssetTransferTxn, PaymentTxn
+
+        self.ensure_one()
+        if self.state not in ("draft", "pending", "authorized"):
+            raise ValidationError(_("This transaction can no longer be paid."))
+        txid = stxn.transaction.get_txid()
+        if self.algorand_tx_id and self.algorand_tx_id != txid:
+            raise ValidationError(
+                _("A payment was already submitted for this transaction.")
+            )
+        if self.search_count(
+            [("algorand_tx_id", "=", txid), ("id", "!=", self.id)], limit=1
+        ):
+            raise ValidationError(
+                _("This payment was already submitted for another transaction.")
+            )
+
+        provider = self.provider_id
+        config = provider._algorand_get_config()
+        network = config["network"]
+        asset = provider._algorand_get_payment_asset(self.currency_id)
+        expected_amount = self.env["algorand.payment.receipt"]._to_microunits(
+            self.amount, asset["decimals"]
+        )
+        txn = stxn.transaction
+        if txn.genesis_id != const.GENESIS_IDS_BY_NETWORK[network]:
+            raise ValidationError(_("The transaction is not for %s.", network))
+        if asset["is_asa"]:
+            if not isinstance(txn, AssetTransferTxn) or txn.index != asset["asset_id"]:
+                raise ValidationError(_("The transaction transfers the wrong asset."))
+            amount = txn.amount
+        else:
+            if not isinstance(txn, PaymentTxn):
+                raise ValidationError(_("The transaction is not an ALGO payment."))
+            amount = txn.amt
+        if txn.receiver != config["merchant_address"]:
+            raise ValidationError(_("The transaction is not paid to the merchant."))
+        if amount != expected_amount:
+            raise ValidationError(
+                _(
+                    "The transaction amount %(amount)s does not match the expected "
+                    "%(expected)s.",
+                    amount=amount,
+                    expected=expected_amount,
+                )
+            )
+        if self._algorand_get_note_tx_id(txn.note) != str(self.id):
+            raise ValidationError(_("The transaction note does not match the order."))
+
+    @api.model
+    def _algorand_get_note_tx_id(self, note):
+        """Return the `tx_id` written by the checkout in a transfer's JSON note.
+
+        :param bytes note: The raw note of the on-chain transfer.
+        :return: The id of the payment.transaction, as a string, or None when
+            the note is missing or malformed.
+        :rtype: str | None
+        """
+        if not note:
+            return None
+        try:
+            data = json.loads(note)
+        except (TypeError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("tx_id") in (None, ""):
+            return None
+        return str(data["tx_id"])
+
+    def _algorand_preflight(self, sender_address):
+        """Check that `sender_address` can pay this transaction before it signs.
+
+        This is a local stand-in for algod's simulate endpoint: the sender's
+        balance, minimum balance and asset holding, and the merchant's opt-in,
+        are read from short-lived cached account data and checked against the
+        amount and the minimum fee of the transfer.
+
+        Note: `self.ensure_one()`
+
+        :param str sender_address: The address of the connected wallet.
+        :return: Whether the payment can proceed, with the failure `type` and
+            `message` otherwise. When algod cannot be reached the check is
+            skipped (`checked` is False) so that the shopper is not blocked.
+        :rtype: dict
+        """
+        self.ensure_one()
+        provider = self.provider_id
+        config = provider._algorand_get_config()
+        node_url, token = config["node_url"], config["node_token"]
+        asset = provider._algorand_get_payment_asset(self.currency_id)
+        amount = self.env["algorand.payment.receipt"]._to_microunits(
+            self.amount, asset["decimals"]
+        )
+        try:
+            fee = algod.min_fee(node_url, token=token)
+            account = algod.account_info(node_url, sender_address, token=token)
+            spendable = account.get("amount", 0) - account.get("min-balance", 0)
+            if asset["is_asa"]:
+                holding = algod.asset_holding(
+                    node_url, sender_address, asset["asset_id"], token=token
+                )
+                merchant_holding = algod.asset_holding(
+                    node_url, config["merchant_address"], asset["asset_id"], token=token
+                )
+            else:
+                holding = merchant_holding = None
+        except algod.AlgodError as e:
+            _logger.warning(
+                "[Algorand][preflight] Skipped for %s, algod unavailable: %s",
+                self.reference,
+                e,
+            )
+            return {"ok": True, "checked": False}
+
+        name = asset["display_name"]
+        if asset["is_asa"]:
+            if merchant_holding is None:
+                return {
+                    "ok": False,
+                    "type": "merchant_not_opted_in",
+                    "message": _("The merchant cannot receive %s yet.", name),
+                }
+            if holding is None:
+                return {
+                    "ok": False,
+                    "type": "not_opted_in",
+                    "message": _("Please opt-in to %s in your wallet.", name),
+                }
+            if holding.get("is-frozen"):
+                return {
+                    "ok": False,
+                    "type": "frozen",
+                    "message": _("Your %s holding is frozen.", name),
+                }
+            if holding.get("amount", 0) < amount:
+                return {
+                    "ok": False,
+                    "type": "insufficient_funds",
+                    "message": _(
+                        "Insufficient funds. Please add more %s to your wallet "
+                        "to complete this payment.",
+                        name,
+                    ),
+                }
+            required_algo = fee
+        else:
+            required_algo = amount + fee
+        if spendable < required_algo:
+            return {
+                "ok": False,
+                "type": "insufficient_funds",
+                "message": _(
+                    "Insufficient funds. Please add more ALGO to your wallet to "
+                    "complete this payment."
+                ),
+            }
+        return {"ok": True, "checked": True}
+
+    @api.model
+    def _algorand_get_confirmation_timeout(self):
+        """Return how long the relay waits for a confirmation, in seconds."""
+        return float(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("algorand_pera_payment.confirmation_timeout", "8")
+        )
+
+    @api.model
+    def _cron_algorand_check_pending(self):
+        """Finalize relayed transactions that were still pending when the relay
+        stopped waiting for their confirmation.
+
+        A transfer that the node does not know once its last valid round has
+        passed can no longer be committed: its transaction is set in error.
+        """
+        txs = self.search(
+            [
+                ("provider_code", "=", "algorand_pera"),
+                ("state", "=", "pending"),
+                ("algorand_tx_id", "!=", False),
+                ("last_state_change", ">=", fields.Datetime.now() - timedelta(days=1)),
+            ]
+        )
+        last_round_by_node = {}
+        for tx in txs:
+            config = tx.provider_id._algorand_get_config()
+            node_url, token = config["node_url"], config["node_token"]
+            try:
+                info = algod.pending_transaction_info(
+                    node_url, tx.algorand_tx_id, token=token
+                )
+            except algod.AlgodError as e:
+                if e.status_code == 404 and tx.algorand_last_valid_round:
+                    if node_url not in last_round_by_node:
+                        try:
+                            last_round_by_node[node_url] = algod.status(
+                                node_url, token=token
+                            )["last-round"]
+                        except algod.AlgodError:
+                            last_round_by_node[node_url] = 0
+                    if last_round_by_node[node_url] > tx.algorand_last_valid_round:
+                        tx._set_error(
+                            _(
+                                "The payment %(txid)s was not committed before "
+                                "round %(round)s and expired.",
+                                txid=tx.algorand_tx_id,
+                                round=tx.algorand_last_valid_round,
+                            )
+                        )
+                        continue
+                _logger.info(
+                    "[Algorand][tx] Pending check failed for %s: %s", tx.reference, e
+                )
+                continue
+            if info.get("pool-error"):
+                tx._set_error(info["pool-error"])
+            elif info.get("confirmed-round"):
+                tx._process(
+                    "algorand_pera",
+                    tx._algorand_prepare_confirmation_data(tx.algorand_tx_id, info),
+                )
+
+    def _algorand_prepare_confirmation_data(self, txid, pending_info):
+        """Return the `_process` payment data of a confirmed on-chain transfer.
+
+        Note: `self.ensure_one()`
+
+        :param str txid: The on-chain transaction id.
+        :param dict pending_info: The pending transaction information of algod.
+        :rtype: dict
+        """
+        self.ensure_one()
+        txn = pending_info.get("txn", {}).get("txn", {})
+        note = txn.get("note")
+        return {
+            "reference": self.reference,
+            "tx_id": txid,
+            "sender_address": txn.get("snd") or self.algorand_sender_address,
+            "confirmed_round": pending_info.get("confirmed-round"),
+            "fee": txn.get("fee"),
+            "note": base64.b64decode(note) if note else None,
+        }
+
+    # === Bulk Notifications === #
+
+    @api.model
+    def _algorand_process_notification_batch(self, provider, notifications):
+        """Apply a batch of on-chain confirmations sent by an indexer or relay.
+
+        All references and on-chain ids are resolved with one search each and
+        the state changes are applied with grouped writes, in the current
+        database transaction. A malformed item only fails its own result.
+
+        :param payment.provider provider: The provider authenticated by the
+            notification token; only its transactions are updated.
+        :param list notifications: The confirmation payloads, each with a
+            `reference` and either a `tx_id` (with optional `sender_address`,
+            `confirmed_round`, `fee` and base64 `note`) or an `error`.
+        :return: The result of each item, in the order of `notifications`.
+        :rtype: list
+        """
+        references = [
+            item["reference"]
+            for item in notifications
+            if isinstance(item, dict) and isinstance(item.get("reference"), str)
+        ]
+        txs_by_reference = {
+            tx.reference: tx
+            for tx in self.search(
+                [
+                    ("reference", "in", [ref for ref in references if ref]),
+                    ("provider_id", "=", provider.id),
+                ]
+            )
+        }
+
+        txids = [
+            item["tx_id"]
+            for item in notifications
+            if isinstance(item, dict) and isinstance(item.get("tx_id"), str)
+        ]
+        txs_by_txid = {
+            tx.algorand_tx_id: tx
+            for tx in self.search([("algorand_tx_id", "in", txids)])
+        }
+
+        results = []
+        to_confirm = self.browse()
+        onchain_data_by_tx = {}
+        references_by_txid = {}
+        errors = {}
+        for item in notifications:
+            reference = isinstance(item, dict) and item.get("reference")
+            if not isinstance(reference, str):
+                reference = None
+            result = {"reference": reference}
+            results.append(result)
+            tx = txs_by_reference.get(reference)
+            if not reference or (not item.get("tx_id") and not item.get("error")):
+                result.update(status="invalid", message="Missing reference or tx_id")
+            elif not tx:
+                result.update(status="not_found")
+            elif tx in to_confirm or tx.id in errors:
+                result.update(status="duplicate")
+            elif tx.state == "done":
+                if tx.algorand_tx_id == item.get("tx_id"):
+                    result.update(status="already_done")
+                else:
+                    result.update(
+                        status="conflict",
+                        message="Transaction already paid by %s" % tx.algorand_tx_id,
+                    )
+            elif tx.state in ("cancel", "error"):
+                result.update(status="invalid", message="Transaction is %s" % tx.state)
+            elif item.get("error"):
+                errors[tx.id] = str(item["error"])
+                result.update(status="error")
+            elif not isinstance(item["tx_id"], str):
+                result.update(status="invalid", message="tx_id must be a string")
+            elif not isinstance(item.get("sender_address") or "", str):
+                result.update(
+                    status="invalid", message="sender_address must be a string"
+                )
+            elif not all(
+                self._algorand_is_valid_counter(item.get(key))
+                for key in ("confirmed_round", "fee")
+            ):
+                result.update(
+                    status="invalid",
+                    message="confirmed_round and fee must be integers in [0, 2^63)",
+                )
+            elif item["tx_id"] in references_by_txid:
+                result.update(
+                    status="conflict",
+                    message="%s already pays %s"
+                    % (item["tx_id"], references_by_txid[item["tx_id"]]),
+                )
+            elif txs_by_txid.get(item["tx_id"], tx) != tx:
+                result.update(
+                    status="conflict",
+                    message="%s already pays %s"
+                    % (item["tx_id"], txs_by_txid[item["tx_id"]].reference),
+                )
+            else:
+                try:
+                    note = base64.b64decode(item["note"]) if item.get("note") else None
+                except (TypeError, ValueError):
+                    result.update(status="invalid", message="Note is not base64")
+                    continue
+                to_confirm |= tx
+                onchain_data_by_tx[tx.id] = dict(item, note=note)
+                references_by_txid[item["tx_id"]] = reference
+                result.update(status="done")
+
+        if to_confirm:
+            to_confirm._algorand_write_onchain_ids(
+                onchain_data_by_tx, provider._algorand_effective_network()
+            )
+        to_confirm._set_done()
+        self.env["algorand.payment.receipt"]._create_from_transactions(
+            to_confirm, onchain_data_by_tx
+        )
+
+        txs_by_error = {}
+        for tx_id, message in errors.items():
+            txs_by_error.setdefault(message, self.browse())
+            txs_by_error[message] |= self.browse(tx_id)
+        for message, txs in txs_by_error.items():
+            txs._set_error(message)
+
+        _logger.info(
+            "[Algorand][notifications] Batch of %s item(s): %s confirmed, %s failed",
+            len(notifications),
+            len(to_confirm),
+            len(errors),
+        )
+        return results
+
+    @api.model
+    def _algorand_is_valid_counter(self, value):
+        """Return whether `value` is missing or a non-negative integer that fits
+        in a BIGINT column, as expected of on-chain rounds and fees."""
+        if value is None:
+            return True
+        if isinstance(value, str) and value.isascii() and value.isdecimal():
+            value = int(value)
+        elif not isinstance(value, int) or isinstance(value, bool):
+            return False
+        return 0 <= value < 2**63
+
+    def _algorand_write_onchain_ids(self, onchain_data_by_tx, network):
+        """Store the on-chain id, sender and network of the transactions with a
+        single UPDATE.
+
+        :param dict onchain_data_by_tx: The on-chain data of each transaction,
+            keyed by transaction id, with a `tx_id` and an optional
+            `sender_address`.
+        :param str network: The network of the transactions that have none.
+        :return: None
+        """
+        fnames = [
+            "provider_reference",
+            "algorand_tx_id",
+            "algorand_sender_address",
+            "algorand_network",
+        ]
+        self.flush_model(fnames)
+        values = SQL(", ").join(
+            SQL(
+                "(%s, %s, %s)",
+                tx.id,
+                onchain_data_by_tx[tx.id]["tx_id"],
+                onchain_data_by_tx[tx.id].get("sender_address") or None,
+            )
+            for tx in self
+        )
+        self.env.cr.execute(
+            SQL(
+                """
+                UPDATE payment_transaction t
+                SET provider_reference = v.tx_id,
+                    algorand_tx_id = v.tx_id,
+                    algorand_sender_address = COALESCE(
+                        v.sender_address, t.algorand_sender_address
+                    ),
+                    algorand_network = COALESCE(t.algorand_network, %s),
+                    write_uid = %s,
+                    write_date = NOW() AT TIME ZONE 'UTC'
+                FROM (VALUES %s) AS v(id, tx_id, sender_address)
+                WHERE t.id = v.id
+                """,
+                network,
+                self.env.uid,
+                values,
+            )
+        )
+        self.invalidate_model(fnames + ["write_uid", "write_date"])
+
+    # === Batched Post-Processing === #
+
+    @api.model
+    def _cron_post_process(self):
+        """Override to create the payments of Algorand transactions in batches
+        before the standard, per-transaction post-processing runs."""
+        self._algorand_cron_create_payments()
+        return super()._cron_post_process()
+
+    @api.model
+    def _algorand_cron_create_payments(self):
+        """Create the `account.payment` of done Algorand transactions, chunk by
+        chunk, committing after each chunk.
+
+        Like the standard post-processing, transactions are only picked up
+        after 10 minutes, leaving the shopper's status poll the time to
+        post-process them, and no longer after 4 days. A failing chunk is
+        rolled back and left to the standard post-processing.
+        """
+        chunk_size = int(
+            self.env["ir.config_parameter"]
+            .sudo()
+            .get_param("algorand_pera_payment.post_process_batch_size", "500")
+        )
+        now = fields.Datetime.now()
+        txs = self.search(
+            [
+                ("provider_code", "=", "algorand_pera"),
+                ("state", "=", "done"),
+                ("is_post_processed", "=", False),
+                ("payment_id", "=", False),
+                ("operation", "!=", "validation"),
+                ("last_state_change", ">=", now - timedelta(days=4)),
+                ("last_state_change", "<=", now - timedelta(minutes=10)),
+            ],
+            order="id",
+        )
+        for offset in range(0, len(txs), chunk_size):
+            chunk = txs[offset : offset + chunk_size]
+            try:
+                chunk._algorand_create_payments()
+                self.env.cr.commit()
+            except Exception:
+                self.env.cr.rollback()
+                _logger.exception(
+                    "[Algorand][post-process] Batch of %s transaction(s) failed",
+                    len(chunk),
+                )
+
+    def _algorand_create_payments(self):
+        """Create, post and reconcile the payments of the transactions in bulk.
+
+        Mirrors `account_payment`'s `_create_payment` for many transactions at
+        once: one `create` and one `action_post` for all payments, then one
+        reconciliation plan holding the lines of each transaction apart, so
+        that a payment is only matched with its own invoices. Are left to the
+        standard flow:
+
+        - transactions whose invoices grant an early payment discount, as it
+          computes the write-off;
+        - with `sale.automatic_invoice`, transactions of sales orders that are
+          not invoiced yet, as their invoice is only created by `sale`'s
+          post-processing and must be reconciled with the payment.
+
+        :return: The created payments.
+        :rtype: account.payment
+        """
+        automatic_invoice = str2bool(
+            self.env["ir.config_parameter"].sudo().get_param("sale.automatic_invoice"),
+            default=False,
+        )
+        txs = self.filtered(
+            lambda tx: tx.provider_code == "algorand_pera"
+            and tx.state == "done"
+            and not tx.payment_id
+            and tx.operation != "validation"
+            and not (automatic_invoice and tx.sale_order_ids and not tx.invoice_ids)
+            and not any(
+                invoice._is_eligible_for_early_payment_discount(
+                    tx.currency_id, tx.last_state_change
+                )
+                for invoice in tx.invoice_ids
+            )
+        )
+        if not txs:
+            return self.env["account.payment"]
+
+        # Prefetch everything the payment values need in a few queries
+        txs.fetch(["reference", "provider_reference", "amount", "currency_id"])
+        txs.provider_id.journal_id.inbound_payment_method_line_ids.fetch(
+            ["payment_provider_id"]
+        )
+        txs.partner_id.fetch(["commercial_partner_id"])
+
+        payments = (
+            self.env["account.payment"]
+            .sudo()
+            .create([tx._algorand_prepare_payment_values() for tx in txs])
+        )
+        payments.action_post()
+        for tx, payment in zip(txs, payments):
+            tx.payment_id = payment
+
+        invoices = txs.invoice_ids.filtered(lambda inv: inv.state != "cancel")
+        invoices.filtered(lambda inv: inv.state == "draft").action_post()
+
+        reconciliation_plan = []
+        for tx, payment in zip(txs, payments):
+            tx_invoices = tx.invoice_ids.filtered(lambda inv: inv.state != "cancel")
+            if not tx_invoices or not payment.move_id:
+                continue
+            account = payment.destination_account_id
+            lines = (payment.move_id.line_ids + tx_invoices.line_ids).filtered(
+                lambda line, account=account: line.account_id == account
+                and not line.reconciled
+            )
+            if lines:
+                reconciliation_plan.append(lines)
+        if reconciliation_plan:
+            self.env["account.move.line"]._reconcile_plan(reconciliation_plan)
+
+        _logger.info(
+            "[Algorand][post-process] Created %s payment(s) in batch", len(payments)
+        )
+        return payments
+
+    def _algorand_prepare_payment_values(self):
+        """Return the `account.payment` values of the transaction, as built by
+        `account_payment`'s `_create_payment`.
+
+        Note: `self.ensure_one()`
+
+        :rtype: dict
+        """
+        self.ensure_one()
+        provider = self.provider_id
+        payment_method_line = (
+            provider.journal_id.inbound_payment_method_line_ids.filtered(
+                lambda line: line.payment_provider_id == provider
+            )
+        )
+        return {
+            "amount": abs(self.amount),
+            "payment_type": "inbound" if self.amount > 0 else "outbound",
+            "currency_id": self.currency_id.id,
+            "partner_id": self.partner_id.commercial_partner_id.id,
+            "partner_type": "customer",
+            "journal_id": provider.journal_id.id,
+            "company_id": provider.company_id.id,
+            "payment_method_line_id": payment_method_line[:1].id,
+            "payment_token_id": self.token_id.id,
+            "payment_transaction_id": self.id,
+            "memo": f"{self.reference} - {self.provider_reference or ''}",
+            "invoice_ids": [Command.set(self.invoice_ids.ids)],
+        }
+
     # === Transaction Processing Methods === #
     # These methods override Odoo's standard payment flow to handle
     # Algorand-specific data
@@ -70,6 +722,21 @@ class PaymentTransaction(models.Model):
             "currency_code": self.currency_id.name,
         }
 
+    @api.model
+    @profiling.profiled(
+        "payment.transaction._process",
+        condition=lambda self, provider_code, *args, **kwargs: (
+            provider_code == "algorand_pera"
+        ),
+    )
+    def _process(self, provider_code, payment_data):
+        """Override to allow capturing slow processing of payments."""
+        return super()._process(provider_code, payment_data)
+
+    @profiling.profiled(
+        "payment.transaction._apply_updates",
+        condition=lambda self, *args, **kwargs: self.provider_code == "algorand_pera",
+    )
     def _apply_updates(self, payment_data):
         """Update transaction record with Algorand blockchain data.
 
@@ -78,8 +745,10 @@ class PaymentTransaction(models.Model):
         stores them, and marks the transaction as done.
 
         Note: Post-processing (account.payment creation, invoice
-        reconciliation) is handled by Odoo's standard cron job, not here.
-        This prevents race conditions and database conflicts.
+        reconciliation) is handled by Odoo's standard cron job, not here,
+        which creates Algorand payments in batches first (see
+        `_algorand_create_payments`). This prevents race conditions and
+        database conflicts.
         """
         if self.provider_code != "algorand_pera":
             return super()._apply_updates(payment_data)
@@ -110,6 +779,8 @@ class PaymentTransaction(models.Model):
             self.algorand_tx_id = tx_hash
         if sender:
             self.algorand_sender_address = sender
+        if not self.algorand_network:
+            self.algorand_network = self.provider_id._algorand_effective_network()
 
         # Algorand transactions are immediately confirmed on-chain
         # Mark transaction as done to trigger post-processing
@@ -120,6 +791,10 @@ class PaymentTransaction(models.Model):
             tx_hash,
             self.state,
         )
+        if self.state == "done":
+            self.env["algorand.payment.receipt"]._create_from_transactions(
+                self, {self.id: payment_data}
+            )
 
         return None
 
@@ -162,9 +837,14 @@ class PaymentTransaction(models.Model):
                 {
                     "algorand_tx_id": tx_id,
                     "algorand_sender_address": sender_address,
+                    "algorand_network": self.algorand_network
+                    or self.provider_id._algorand_effective_network(),
                     "state": "done",
                 }
             )
+            self.env["algorand.payment.receipt"]._create_from_transactions(
+                self, {self.id: notification_data}
+            )
             _logger.info("Algorand payment confirmed: %s", tx_id)
         else:
             self.write({"state": "error"})
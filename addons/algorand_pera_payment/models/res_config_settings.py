@@ -15,6 +15,8 @@ class ResConfigSettings(models.TransientModel):
 
     def set_values(self):
         super().set_values()
+        # Writing the parameters clears the cached provider configurations
+        # (see `payment.provider._algorand_get_config`)
         icp = self.env["ir.config_parameter"].sudo()
         icp.set_param("algorand.merchant_address", self.algorand_merchant_address or "")
         icp.set_param("algorand.algod_url", self.algorand_algod_url or "")
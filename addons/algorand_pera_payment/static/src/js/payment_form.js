@@ -7,6 +7,110 @@ import { patch } from '@web/core/utils/patch';
 
 import { PaymentForm } from '@payment/interactions/payment_form';
 
+const ALGOSDK_URL = 'https://esm.sh/algosdk@3.5.2';
+const PERA_CONNECT_URL = 'https://esm.sh/@perawallet/connect@1.4.2?bundle';
+const SDK_LOAD_TIMEOUT_MS = 7000;
+const SUGGESTED_PARAMS_TTL_MS = 30000;
+const OPTIN_CONFIRMATION_ROUNDS = 4;
+
+// Page-wide shared state: the SDK modules are imported once, one algod client
+// is kept per node and the suggested params are reused for a few seconds.
+let algosdkPromise = null;
+let peraConnectPromise = null;
+const algodClients = new Map();
+const suggestedParamsCache = new Map();
+
+/**
+ * Import algosdk once per page; a failed import is retried on the next call.
+ */
+function loadAlgosdk() {
+    if (!algosdkPromise) {
+        let timeoutId;
+        const timeout = new Promise((_, reject) => {
+            timeoutId = setTimeout(() => reject(new Error('algosdk import timeout')), SDK_LOAD_TIMEOUT_MS);
+        });
+        algosdkPromise = Promise.race([import(ALGOSDK_URL), timeout])
+            .then((mod) => {
+                console.info('[Algorand][frontend] algosdk loaded');
+                return mod;
+            })
+            .catch((e) => {
+                console.error('[Algorand][frontend] algosdk failed to load', e);
+                algosdkPromise = null;
+                throw e;
+            })
+            .finally(() => clearTimeout(timeoutId));
+    }
+    return algosdkPromise;
+}
+
+/**
+ * Import Pera Wallet Connect once per page.
+ */
+function loadPeraWalletConnect() {
+    if (window.PeraWalletConnect) {
+        return Promise.resolve(window.PeraWalletConnect);
+    }
+    if (!peraConnectPromise) {
+        peraConnectPromise = import(PERA_CONNECT_URL)
+            .then((mod) => {
+                const PeraWalletConnect = mod.PeraWalletConnect || mod.default;
+                if (!PeraWalletConnect) throw new Error('PeraWalletConnect export missing');
+                window.PeraWalletConnect = PeraWalletConnect;
+                console.info('[Algorand][frontend] PeraWalletConnect loaded');
+                return PeraWalletConnect;
+            })
+            .catch((e) => {
+                console.error('[Algorand][frontend] Pera SDK failed to load', e);
+                peraConnectPromise = null;
+                throw e;
+            });
+    }
+    return peraConnectPromise;
+}
+
+/**
+ * Return the shared algod client of a node.
+ */
+async function getAlgodClient(nodeUrl) {
+    const algosdk = await loadAlgosdk();
+    if (!algodClients.has(nodeUrl)) {
+        algodClients.set(nodeUrl, new algosdk.Algodv2('', nodeUrl, ''));
+    }
+    return algodClients.get(nodeUrl);
+}
+
+/**
+ * Return algosdk v3 suggested params of a node, cached for a few seconds: their
+ * validity window spans 1000 rounds, far longer than the cache.
+ */
+function getSuggestedParams(nodeUrl) {
+    const cached = suggestedParamsCache.get(nodeUrl);
+    if (cached && cached.expiry > Date.now()) {
+        return cached.promise;
+    }
+    const promise = getAlgodClient(nodeUrl)
+        .then((algod) => algod.getTransactionParams().do())
+        .then((params) => {
+            console.debug('[Algorand][frontend] raw params', params);
+            const minFee = Number(params.minFee ?? params.fee ?? 1000);
+            return {
+                fee: Math.max(1000, minFee),
+                flatFee: true,
+                firstValid: Number(params.firstValid ?? params["first-round"] ?? params.firstRound),
+                lastValid: Number(params.lastValid ?? params["last-round"] ?? params.lastRound),
+                genesisID: params.genesisID,
+                genesisHash: params.genesisHash,
+            };
+        })
+        .catch((e) => {
+            suggestedParamsCache.delete(nodeUrl);
+            throw e;
+        });
+    suggestedParamsCache.set(nodeUrl, { promise, expiry: Date.now() + SUGGESTED_PARAMS_TTL_MS });
+    return promise;
+}
+
 
 patch(PaymentForm.prototype, {
 
@@ -151,44 +255,11 @@ patch(PaymentForm.prototype, {
         }
         
         try {
-            // Load Algorand SDK
+            // The SDK module and suggested params are shared per page and were
+            // warmed up when the Algorand method was selected.
             console.info('[Algorand][frontend] loading algosdk');
-            const algosdk = await (async function loadAlgorandSdkWithTimeout() {
-                const timeoutMs = 7000;
-                let timeoutId;
-                const t = new Promise((_, rej) => {
-                    timeoutId = setTimeout(() => rej(new Error('algosdk import timeout')), timeoutMs);
-                });
-                try {
-                    const mod = await Promise.race([
-                        import('https://esm.sh/algosdk@3.5.2'),
-                        t,
-                    ]);
-                    clearTimeout(timeoutId);
-                    console.info('[Algorand][frontend] algosdk loaded');
-                    return mod;
-                } catch (e) {
-                    console.error('[Algorand][frontend] algosdk failed to load', e);
-                    throw e;
-                }
-            })();
-            
-            const algodClient = new algosdk.Algodv2('', values.node_url, '');
-            const params = await algodClient.getTransactionParams().do();
-            console.info('[Algorand][frontend] fetched suggested params');
-            console.debug('[Algorand][frontend] raw params', params);
-            
-            // Build algosdk v3 SuggestedParams (expects firstValid/lastValid keys)
-            const minFee = Number(params.minFee ?? params.fee ?? 1000);
-            const suggestedParams = {
-                fee: Math.max(1000, minFee),
-                flatFee: true,
-                firstValid: Number(params.firstValid ?? params["first-round"] ?? params.firstRound),
-                lastValid: Number(params.lastValid ?? params["last-round"] ?? params.lastRound),
-                genesisID: params.genesisID,
-                genesisHash: params.genesisHash,
-            };
-            console.debug('[Algorand][frontend] suggestedParams (firstValid/lastValid)', suggestedParams);
+            const algosdk = await loadAlgosdk();
+            const suggestedParamsPromise = getSuggestedParams(values.node_url);
 
             const senderAddress = (connectedAddressValue || '').trim();
             const receiverAddress = (values.merchant_address || '').trim();
@@ -207,6 +278,26 @@ patch(PaymentForm.prototype, {
             if (!algosdk.isValidAddress(receiverAddress)) {
                 throw new Error('Merchant address appears invalid. Please contact support.');
             }
+            // Pre-flight: reject doomed payments (insufficient funds, missing
+            // opt-in) before the shopper is asked to sign anything.
+            const paymentTxId = (processingValues && processingValues.tx_id) || (values && values.tx_id) || null;
+            const preflightPromise = fetch('/payment/algorand_pera/preflight', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({
+                    jsonrpc: '2.0',
+                    method: 'call',
+                    params: { tx_id: paymentTxId, sender_address: senderAddress },
+                }),
+            }).then((response) => response.json()).catch(() => ({}));
+            const [suggestedParams, preflightData] = await Promise.all([suggestedParamsPromise, preflightPromise]);
+            console.debug('[Algorand][frontend] suggestedParams (firstValid/lastValid)', suggestedParams);
+            const preflight = preflightData.result || {};
+            console.info('[Algorand][frontend] preflight result', preflight);
+            if (preflight.ok === false) {
+                throw new Error(preflight.message || 'Payment cannot be completed with this wallet.');
+            }
+
             console.debug('[Algorand][frontend] txn inputs', {
                 isASA: !!(values.is_asa && values.asset_id),
                 assetId: values.asset_id,
@@ -267,21 +358,7 @@ patch(PaymentForm.prototype, {
             
             // Load Pera Wallet Connect (use existing instance if available)
             console.info('[Algorand][frontend] loading PeraWalletConnect');
-            const PeraWalletConnect = await (async () => {
-                try {
-                    if (window.PeraWalletConnect) return window.PeraWalletConnect;
-                    // Use ESM bundle from jsDelivr (no artificial timeouts or retries)
-                    const mod = await import('https://cdn.jsdelivr.net/npm/@perawallet/connect@1.4.2/dist/pera-wallet-connect.mjs');
-                    const P = mod.PeraWalletConnect || mod.default;
-                    if (!P) throw new Error('PeraWalletConnect export missing');
-                    window.PeraWalletConnect = P;
-                    console.info('[Algorand][frontend] PeraWalletConnect loaded');
-                    return P;
-                } catch (e) {
-                    console.error('[Algorand][frontend] Pera SDK failed to load', e);
-                    throw e;
-                }
-            })();
+            const PeraWalletConnect = await loadPeraWalletConnect();
             let peraWallet = window.peraWalletInstance;
             if (!peraWallet) {
                 const chainId = (values.network === 'mainnet') ? 416001 : 416002;
@@ -308,15 +385,11 @@ patch(PaymentForm.prototype, {
                 throw new Error('No signed bytes returned by Pera');
             }
 
-            // Broadcast transaction with flat bytes array
-            console.info('[Algorand][frontend] broadcasting transaction');
-            const sendResult = await algodClient.sendRawTransaction(signedBytes).do();
-            console.debug('[Algorand][frontend] sendResult', sendResult);
-            const txid = sendResult.txId || sendResult.txid;
-            
-            // Submit the payment to Odoo backend (best-effort)
-            console.info('[Algorand][frontend] notifying backend /payment/algorand_pera/process');
-            const response = await fetch('/payment/algorand_pera/process', {
+            // Relay the signed transaction through Odoo: the server validates it
+            // against the payment.transaction, broadcasts it and waits for the
+            // confirmation, all in a single round trip.
+            console.info('[Algorand][frontend] submitting signed transaction to /payment/algorand_pera/submit');
+            const response = await fetch('/payment/algorand_pera/submit', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -326,8 +399,7 @@ patch(PaymentForm.prototype, {
                     method: 'call',
                     params: {
                         tx_id: (processingValues && processingValues.tx_id) || (values && values.tx_id) || (this.paymentContext && this.paymentContext.txId) || null,
-                        tx_hash: txid,
-                        sender_address: connectedAddressValue,
+                        signed_txn: algosdk.bytesToBase64(signedBytes[0]),
                     }
                 })
             });
@@ -378,18 +450,6 @@ patch(PaymentForm.prototype, {
         }
     },
 
-    /**
-     * Load Pera Wallet Connect SDK
-     */
-    async _loadPeraWalletConnect() {
-        if (window.PeraWalletConnect) {
-            return window.PeraWalletConnect;
-        }
-        const module = await import('https://esm.sh/@perawallet/connect@1.4.2?bundle');
-        window.PeraWalletConnect = module.PeraWalletConnect || module.default;
-        return window.PeraWalletConnect;
-    },
-
             /**
             * Get Algorand form values
             */
@@ -464,6 +524,13 @@ patch(PaymentForm.prototype, {
                 const html = `
                     <div class="o_payment_algorand_pera">
 
+                        ${values.node_healthy === false ? `
+                        <div class="alert alert-warning mb-3" role="alert">
+                            <i class="fas fa-exclamation-triangle me-2"></i>
+                            The Algorand network is currently slow to respond. Your payment may take longer than usual.
+                        </div>
+                        ` : ''}
+
                         <!-- Connect Wallet Section -->
                         <div class="text-center mb-4">
                             <button id="connect-pera-btn" class="btn btn-primary btn-lg px-4">
@@ -615,41 +682,17 @@ patch(PaymentForm.prototype, {
             observer.observe(connectedAddress, { childList: true, subtree: true, characterData: true });
         }
 
-        async function loadPeraWalletConnect() {
-            if (window.PeraWalletConnect) {
-                return window.PeraWalletConnect;
-            }
-            const module = await import('https://esm.sh/@perawallet/connect@1.4.2?bundle');
-            window.PeraWalletConnect = module.PeraWalletConnect || module.default;
-            return window.PeraWalletConnect;
-        }
-
-        async function getAlgodClient() {
-            const algosdk = await import('https://esm.sh/algosdk@3.5.2');
-            return new algosdk.Algodv2('', values.node_url, '');
-        }
-
-        async function refreshSuggestedParams(algodClient) {
-            const params = await algodClient.getTransactionParams().do();
-            const minFee = Number(params.minFee ?? 1000);
-            return {
-                fee: minFee,
-                flatFee: true,
-                firstRound: Number(params.firstRound ?? params["first-round"] ?? params.firstValid),
-                lastRound: Number(params.lastRound ?? params["last-round"] ?? params.lastValid),
-                genesisID: params.genesisID,
-                genesisHash: params.genesisHash
-            };
-        }
-
         async function isAsaOptedIn(address, assetId) {
             try {
-                const algod = await getAlgodClient();
-                const info = await algod.accountInformation(address).do();
-                const assets = Array.isArray(info.assets) ? info.assets : (info["assets"] || []);
-                return assets.some((a) => Number(a["asset-id"] ?? a.assetId ?? a["asset-id"]) === Number(assetId));
+                const algod = await getAlgodClient(values.node_url);
+                await algod.accountAssetInformation(address, Number(assetId)).do();
+                return true;
             } catch (e) {
-                console.warn('ASA opt-in check failed:', e);
+                // algod answers 404 when the account holds no such asset
+                const status = e && (e.status ?? (e.response && e.response.status));
+                if (status !== 404) {
+                    console.warn('ASA opt-in check failed:', e);
+                }
                 return false;
             }
         }
@@ -675,30 +718,27 @@ patch(PaymentForm.prototype, {
         }
 
         async function performAsaOptIn(address, assetId) {
-            const algosdk = await import('https://esm.sh/algosdk@3.5.2');
-            const algod = await getAlgodClient();
-            const suggestedParams = await refreshSuggestedParams(algod);
+            const [algosdk, algod, suggestedParams] = await Promise.all([
+                loadAlgosdk(),
+                getAlgodClient(values.node_url),
+                getSuggestedParams(values.node_url),
+            ]);
             const txn = algosdk.makeAssetTransferTxnWithSuggestedParamsFromObject({
-                from: address,
-                to: address,
+                sender: address,
+                receiver: address,
                 amount: 0,
                 assetIndex: Number(assetId),
                 suggestedParams,
             });
-            const txnGroup = [{ txn }];
-            const signed = await peraWallet.signTransaction(txnGroup);
+            const signed = await peraWallet.signTransaction([[{ txn }]]);
             const res = await algod.sendRawTransaction(signed).do();
-            const txid = res.txId || res.txid;
-            // wait for confirmation (simple loop)
+            const txid = res.txid || res.txId;
+            // A single bounded wait; the opt-in state is re-checked afterwards
             try {
-                const rounds = 8;
-                let last = (await algod.status().do())["last-round"]; 
-                for (let i = 0; i < rounds; i++) {
-                    await algod.statusAfterBlock(++last).do();
-                    const p = await algod.pendingTransactionInformation(txid).do();
-                    if ((p["confirmed-round"] || 0) > 0) break;
-                }
-            } catch (_) {}
+                await algosdk.waitForConfirmation(algod, txid, OPTIN_CONFIRMATION_ROUNDS);
+            } catch (e) {
+                console.warn('[Algorand][frontend] opt-in not confirmed yet', e);
+            }
             return txid;
         }
 
@@ -720,10 +760,19 @@ patch(PaymentForm.prototype, {
                     if (asaOptinBtn) asaOptinBtn.classList.remove('disabled');
                 }
             }
-            // Also check merchant ASA state
-            await refreshMerchantAsaState();
         }
 
+        async function refreshAsaStates() {
+            await Promise.all([afterConnectEnsureAsaOptIn(), refreshMerchantAsaState()]);
+        }
+
+        // Warm up the SDKs, the suggested params and the merchant opt-in state
+        // as soon as the method is displayed, so that connecting and paying
+        // do not wait for them.
+        loadPeraWalletConnect().catch(() => {});
+        getSuggestedParams(values.node_url).catch(() => {});
+        refreshMerchantAsaState();
+
         connectBtn.addEventListener('click', async function() {
                         connectBtn.disabled = true;
                         connectBtn.innerHTML = '<i class="fas fa-spinner fa-spin me-2"></i>Connecting...';
@@ -759,8 +808,8 @@ patch(PaymentForm.prototype, {
                     // Update pay button state after connection
                     updatePayButtonState();
                     
-                    // After connect, check ASA opt-in if required
-                    await afterConnectEnsureAsaOptIn();
+                    // After connect, check both ASA opt-ins concurrently
+                    await refreshAsaStates();
                 } else {
                     throw new Error('No account connected');
                 }
@@ -806,10 +855,8 @@ patch(PaymentForm.prototype, {
                     if (asaOptinState) asaOptinState.textContent = '';
                     const txid = await performAsaOptIn(connectedAddressValue, values.asset_id);
                     if (asaOptinState) asaOptinState.textContent = `Opt-in sent, tx: ${txid}`;
-                    // Re-check opt-in state
-                    await afterConnectEnsureAsaOptIn();
-                    // Refresh merchant state as well
-                    await refreshMerchantAsaState();
+                    // Re-check both opt-in states
+                    await refreshAsaStates();
                 } catch (e) {
                     console.error('ASA opt-in failed:', e);
                     if (asaOptinState) asaOptinState.textContent = 'Opt-in failed. Please try again.';
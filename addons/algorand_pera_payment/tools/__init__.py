@@ -0,0 +1,8 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from . import algod
+from . import export
+from . import migration
+from . import profiling
+from . import rate_limit
@@ -0,0 +1,235 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+"""Minimal algod REST client sharing pooled HTTP connections.
+
+One `requests.Session` is kept per node URL and worker process, so that
+consecutive calls to the same node reuse their keep-alive connections instead
+of opening a new TLS connection each time, as `algosdk`'s urllib client does.
+"""
+
+import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 10
+TOKEN_HEADER = "X-Algo-API-Token"
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+# Short-lived cache of account state, keyed by request; see `_cached`
+ACCOUNT_CACHE_TTL = 10
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class AlgodError(Exception):
+    """Raised when algod rejects a request or cannot be reached.
+
+    :param str message: The error message of algod.
+    :param int status_code: The HTTP status of the response, if any.
+    """
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class PoolError(AlgodError):
+    """Raised when a transaction was evicted from the pool and will never be
+    committed."""
+
+
+def _get_session(node_url):
+    with _sessions_lock:
+        session = _sessions.get(node_url)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[node_url] = session
+        return session
+
+
+def _request(node_url, method, path, token=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    headers = kwargs.pop("headers", {})
+    if token:
+        headers[TOKEN_HEADER] = token
+    url = node_url.rstrip("/") + path
+    try:
+        response = _get_session(node_url).request(
+            method, url, headers=headers, timeout=timeout, **kwargs
+        )
+    except requests.RequestException as e:
+        raise AlgodError(str(e)) from e
+    if not response.ok:
+        try:
+            message = response.json().get("message") or response.text
+        except ValueError:
+            message = response.text
+        raise AlgodError(message, status_code=response.status_code)
+    return response.json()
+
+
+def _cached(key, ttl, fetch):
+    """Return the cached value of `key`, calling `fetch` when missing or older
+    than `ttl` seconds."""
+    now = time.monotonic()
+    with _cache_lock:
+        entry = _cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+    value = fetch()
+    with _cache_lock:
+        if len(_cache) > 10000:
+            _cache.clear()
+        _cache[key] = (now + ttl, value)
+    return value
+
+
+def status(node_url, token=None, timeout=DEFAULT_TIMEOUT):
+    """Return the node status (``GET /v2/status``)."""
+    return _request(node_url, "GET", "/v2/status", token=token, timeout=timeout)
+
+
+def send_raw_transaction(node_url, signed_bytes, token=None, timeout=DEFAULT_TIMEOUT):
+    """Broadcast msgpack-encoded signed transaction(s) and return the tx id."""
+    result = _request(
+        node_url,
+        "POST",
+        "/v2/transactions",
+        token=token,
+        timeout=timeout,
+        data=signed_bytes,
+        headers={"Content-Type": "application/x-binary"},
+    )
+    return result["txId"]
+
+
+def pending_transaction_info(node_url, txid, token=None, timeout=DEFAULT_TIMEOUT):
+    """Return the pool information of a transaction, including its confirmed
+    round once committed."""
+    return _request(
+        node_url,
+        "GET",
+        f"/v2/transactions/pending/{txid}",
+        token=token,
+        timeout=timeout,
+        params={"format": "json"},
+    )
+
+
+def wait_for_confirmation(node_url, txid, max_wait, token=None):
+    """Wait until `txid` is committed, for at most `max_wait` seconds.
+
+    The wait relies on algod's ``wait-for-block-after`` long poll: the worker
+    sleeps on the socket until the next block instead of polling. Every call
+    is bounded by the remaining time budget, so that a slow node cannot hold
+    the worker much longer than `max_wait`.
+
+    :return: The pending transaction information once confirmed, or None if
+        the transaction is still pending when the time budget is exhausted.
+    :rtype: dict | None
+    :raise PoolError: If the transaction was rejected from the pool.
+    :raise AlgodError: If algod could not be reached.
+    """
+    deadline = time.monotonic() + max_wait
+
+    def call_timeout():
+        return max(0.1, min(DEFAULT_TIMEOUT, deadline - time.monotonic()))
+
+    last_round = status(node_url, token=token, timeout=call_timeout())["last-round"]
+    while True:
+        info = pending_transaction_info(
+            node_url, txid, token=token, timeout=call_timeout()
+        )
+        if info.get("confirmed-round"):
+            return info
+        if info.get("pool-error"):
+            raise PoolError(info["pool-error"])
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        try:
+            last_round = _request(
+                node_url,
+                "GET",
+                f"/v2/status/wait-for-block-after/{last_round}",
+                token=token,
+                timeout=call_timeout(),
+            )["last-round"]
+        except AlgodError:
+            if time.monotonic() >= deadline:
+                return None
+            raise
+
+
+def asset_info(node_url, asset_id, token=None, timeout=DEFAULT_TIMEOUT):
+    """Return the parameters of an asset (``GET /v2/assets/{asset_id}``)."""
+    return _request(
+        node_url, "GET", f"/v2/assets/{asset_id}", token=token, timeout=timeout
+    )
+
+
+def account_info(node_url, address, token=None, ttl=ACCOUNT_CACHE_TTL):
+    """Return the balance and minimum balance of an account, in microAlgos.
+
+    Results are cached for `ttl` seconds per worker.
+
+    :return: The `amount` and `min-balance` of the account.
+    :rtype: dict
+    """
+    return _cached(
+        ("account", node_url, address),
+        ttl,
+        lambda: _request(
+            node_url,
+            "GET",
+            f"/v2/accounts/{address}",
+            token=token,
+            params={"exclude": "all"},
+        ),
+    )
+
+
+def asset_holding(node_url, address, asset_id, token=None, ttl=ACCOUNT_CACHE_TTL):
+    """Return the holding of an account for an asset, or None if the account is
+    not opted-in.
+
+    Results are cached for `ttl` seconds per worker.
+
+    :return: The `amount` and `is-frozen` of the holding.
+    :rtype: dict | None
+    """
+
+    def fetch():
+        try:
+            return _request(
+                node_url,
+                "GET",
+                f"/v2/accounts/{address}/assets/{asset_id}",
+                token=token,
+            )["asset-holding"]
+        except AlgodError as e:
+            if "not found" in str(e).lower():
+                return None
+            raise
+
+    return _cached(("holding", node_url, address, asset_id), ttl, fetch)
+
+
+def min_fee(node_url, token=None, ttl=ACCOUNT_CACHE_TTL):
+    """Return the current minimum transaction fee, in microAlgos."""
+    params = _cached(
+        ("params", node_url),
+        ttl,
+        lambda: _request(node_url, "GET", "/v2/transactions/params", token=token),
+    )
+    return params.get("min-fee", 1000)
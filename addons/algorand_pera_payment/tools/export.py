@@ -0,0 +1,150 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+"""Constant-memory export of the Algorand payment receipts.
+
+Receipts are read in keyset-paginated chunks (``(confirmed_date, id) > last
+ORDER BY confirmed_date, id``) from a dedicated cursor, whose repeatable-read
+snapshot keeps the chunks consistent with each other. CSV rows are encoded
+and handed over to the HTTP response as they are read; XLSX workbooks are
+written in xlsxwriter's ``constant_memory`` mode to a temporary file, which is
+then streamed in blocks.
+"""
+
+import csv
+import io
+import logging
+import tempfile
+
+import xlsxwriter
+
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 2000
+BLOCK_SIZE = 64 * 1024
+XLSX_MAX_ROWS = 1048576
+
+HEADERS = [
+    "Confirmed Date (UTC)",
+    "Network",
+    "Transaction Hash",
+    "Sender",
+    "Receiver",
+    "Asset ID",
+    "Amount",
+    "Currency",
+    "Amount (microunits)",
+    "Fee (microAlgos)",
+    "Confirmed Round",
+    "Payment Reference",
+    "Order Reference",
+    "Company",
+]
+
+
+def iter_receipt_rows(registry, company_ids, date_from, date_to, chunk_size=CHUNK_SIZE):
+    """Yield the receipts confirmed in ``[date_from, date_to)`` as tuples
+    ordered like `HEADERS`.
+
+    :param registry: The registry of the database, to open a dedicated cursor
+        that outlives the request.
+    :param list company_ids: The companies whose receipts are exported.
+    :param datetime date_from: The inclusive lower bound, in UTC.
+    :param datetime date_to: The exclusive upper bound, in UTC.
+    :param int chunk_size: The number of rows fetched per query.
+    """
+    count = 0
+    with registry.cursor() as cr:
+        last_date, last_id = date_from, 0
+        while True:
+            cr.execute(
+                SQL(
+                    """
+                    SELECT r.id, r.confirmed_date, r.network, r.tx_hash,
+                           r.sender_address, r.receiver_address, r.asset_id,
+                           r.amount, cur.name, r.amount_micro, r.fee_micro,
+                           r.confirmed_round, tx.reference, so.names, comp.name
+                    FROM algorand_payment_receipt r
+                    JOIN payment_transaction tx ON tx.id = r.transaction_id
+                    JOIN res_currency cur ON cur.id = r.currency_id
+                    LEFT JOIN res_company comp ON comp.id = r.company_id
+                    LEFT JOIN LATERAL (
+                        SELECT string_agg(o.name, ', ' ORDER BY o.name) AS names
+                        FROM sale_order_transaction_rel rel
+                        JOIN sale_order o ON o.id = rel.sale_order_id
+                        WHERE rel.transaction_id = tx.id
+                    ) so ON TRUE
+                    WHERE (r.confirmed_date, r.id) > (%s, %s)
+                      AND r.confirmed_date < %s
+                      AND (r.company_id IS NULL OR r.company_id = ANY(%s))
+                    ORDER BY r.confirmed_date, r.id
+                    LIMIT %s
+                    """,
+                    last_date,
+                    last_id,
+                    date_to,
+                    list(company_ids),
+                    chunk_size,
+                )
+            )
+            rows = cr.fetchall()
+            for row in rows:
+                yield row[1:]
+            count += len(rows)
+            if len(rows) < chunk_size:
+                break
+            last_id, last_date = rows[-1][0], rows[-1][1]
+    _logger.info("[Algorand][export] Exported %s receipt(s)", count)
+
+
+def iter_csv(rows):
+    """Yield the CSV encoding of `rows`, in blocks of about `BLOCK_SIZE`."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(HEADERS)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= BLOCK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def write_xlsx(rows):
+    """Write `rows` to an XLSX workbook in a temporary file.
+
+    Rows are flushed to disk as they are written; a new sheet is started
+    whenever one is full.
+
+    :return: The temporary file, positioned at its start.
+    """
+    file = tempfile.TemporaryFile()
+    workbook = xlsxwriter.Workbook(file, {"constant_memory": True})
+    bold = workbook.add_format({"bold": True})
+    date_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+    sheet, row_index = None, XLSX_MAX_ROWS
+    for row in rows:
+        if row_index >= XLSX_MAX_ROWS:
+            sheet = workbook.add_worksheet()
+            sheet.set_column(0, 0, 20)
+            sheet.set_column(2, 4, 58)
+            sheet.write_row(0, 0, HEADERS, bold)
+            row_index = 1
+        sheet.write_datetime(row_index, 0, row[0], date_format)
+        sheet.write_row(row_index, 1, row[1:])
+        row_index += 1
+    if sheet is None:
+        workbook.add_worksheet().write_row(0, 0, HEADERS, bold)
+    workbook.close()
+    file.seek(0)
+    return file
+
+
+def iter_file(file):
+    """Yield the content of `file` in blocks of `BLOCK_SIZE`, then close it."""
+    with file:
+        while block := file.read(BLOCK_SIZE):
+            yield block
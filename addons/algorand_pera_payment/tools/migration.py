@@ -0,0 +1,162 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+"""Helpers to run migrations and backfills over large tables.
+
+Rows are walked in keyset-paginated chunks (``id > last_id ORDER BY id``) and
+the cursor is committed after each chunk, so that no statement holds a lock on
+the whole table. The last processed id is checkpointed in
+``ir_config_parameter``: an interrupted migration resumes where it stopped the
+next time it runs.
+"""
+
+import logging
+import time
+
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 5000
+CHECKPOINT_KEY = "algorand_pera_payment.migration.%s"
+
+
+def _get_checkpoint(cr, name):
+    cr.execute(
+        SQL(
+            "SELECT value FROM ir_config_parameter WHERE key = %s",
+            CHECKPOINT_KEY % name,
+        )
+    )
+    row = cr.fetchone()
+    return int(row[0]) if row and row[0] else 0
+
+
+def _set_checkpoint(cr, name, last_id):
+    cr.execute(
+        SQL(
+            """
+            INSERT INTO ir_config_parameter (key, value, create_date, write_date)
+            VALUES (%s, %s, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC')
+            ON CONFLICT (key) DO UPDATE
+            SET value = EXCLUDED.value, write_date = EXCLUDED.write_date
+            """,
+            CHECKPOINT_KEY % name,
+            str(last_id),
+        )
+    )
+
+
+def _clear_checkpoint(cr, name):
+    cr.execute(
+        SQL("DELETE FROM ir_config_parameter WHERE key = %s", CHECKPOINT_KEY % name)
+    )
+
+
+def has_rows(cr, table, where=None):
+    """Return whether `table` has at least one row matching `where`.
+
+    :param cr: The database cursor.
+    :param str table: The name of the table.
+    :param SQL where: The filtering condition, all rows if not set.
+    :rtype: bool
+    """
+    cr.execute(
+        SQL(
+            "SELECT 1 FROM %s WHERE %s LIMIT 1",
+            SQL.identifier(table),
+            where or SQL("TRUE"),
+        )
+    )
+    return bool(cr.fetchone())
+
+
+def iter_id_chunks(cr, name, table, where=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the ids of `table` matching `where`, in ascending chunks.
+
+    The cursor is committed and the progress checkpointed after each chunk has
+    been processed by the caller. The checkpoint is cleared once all rows have
+    been yielded.
+
+    :param cr: The database cursor.
+    :param str name: The unique name of the migration, used for checkpointing.
+    :param str table: The name of the table.
+    :param SQL where: The filtering condition, all rows if not set.
+    :param int chunk_size: The maximum number of ids per chunk.
+    :return: A generator of id lists.
+    """
+    where = where or SQL("TRUE")
+    last_id = _get_checkpoint(cr, name)
+    if last_id:
+        _logger.info(
+            "[Algorand][migration] %s: resuming %s after id %s", name, table, last_id
+        )
+    processed = 0
+    start = time.monotonic()
+    while True:
+        cr.execute(
+            SQL(
+                "SELECT id FROM %s WHERE id > %s AND (%s) ORDER BY id LIMIT %s",
+                SQL.identifier(table),
+                last_id,
+                where,
+                chunk_size,
+            )
+        )
+        ids = [row[0] for row in cr.fetchall()]
+        if not ids:
+            break
+        yield ids
+        last_id = ids[-1]
+        processed += len(ids)
+        _set_checkpoint(cr, name, last_id)
+        cr.commit()
+        _logger.info(
+            "[Algorand][migration] %s: %s row(s) of %s processed (last id %s, "
+            "%.1fs)",
+            name,
+            processed,
+            table,
+            last_id,
+            time.monotonic() - start,
+        )
+    _clear_checkpoint(cr, name)
+    cr.commit()
+    _logger.info(
+        "[Algorand][migration] %s: done, %s row(s) of %s processed in %.1fs",
+        name,
+        processed,
+        table,
+        time.monotonic() - start,
+    )
+
+
+def chunked_update(
+    cr, name, table, set_clause, where=None, chunk_size=DEFAULT_CHUNK_SIZE
+):
+    """Run ``UPDATE table SET set_clause`` on the rows matching `where`, chunk
+    by chunk.
+
+    See `iter_id_chunks` for the chunking, commit and resume behaviour.
+
+    :param cr: The database cursor.
+    :param str name: The unique name of the migration, used for checkpointing.
+    :param str table: The name of the table.
+    :param SQL set_clause: The assignments of the update.
+    :param SQL where: The filtering condition, all rows if not set.
+    :param int chunk_size: The maximum number of rows updated per chunk.
+    :return: The number of updated rows.
+    :rtype: int
+    """
+    updated = 0
+    for ids in iter_id_chunks(cr, name, table, where=where, chunk_size=chunk_size):
+        cr.execute(
+            SQL(
+                "UPDATE %s SET %s WHERE id = ANY(%s)",
+                SQL.identifier(table),
+                set_clause,
+                ids,
+            )
+        )
+        updated += cr.rowcount
+    return updated
@@ -0,0 +1,102 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+"""Opt-in capture of slow Algorand payment requests.
+
+When the ``algorand_pera_payment.profiling_threshold_ms`` system parameter is
+set, the decorated controllers and methods run under Odoo's profiler, with
+the SQL and sampling (``traces_async``) collectors. Calls slower than the
+threshold are stored as `ir.profile` records, with their SQL query count and
+timings, and can be opened in speedscope from Settings > Technical >
+Profiling. Faster calls are discarded. Nested decorated calls are captured by
+the outermost one only.
+"""
+
+import functools
+import json
+import logging
+import threading
+
+from odoo import SUPERUSER_ID, api, models
+from odoo.http import request
+from odoo.tools.profiler import Profiler
+
+_logger = logging.getLogger(__name__)
+
+THRESHOLD_PARAM = "algorand_pera_payment.profiling_threshold_ms"
+
+_local = threading.local()
+
+
+def _get_threshold(env):
+    try:
+        return int(env["ir.config_parameter"].sudo().get_param(THRESHOLD_PARAM) or 0)
+    except ValueError:
+        return 0
+
+
+def _save(env, name, profiler):
+    sql_entries = [
+        entry
+        for collector in profiler.collectors
+        if collector.name == "sql"
+        for entry in collector.entries
+    ]
+    sql_time_ms = sum(entry["time"] for entry in sql_entries) * 1000
+    values = {
+        "name": "[Algorand] %s (%d ms, %d queries, %d ms SQL)"
+        % (name, profiler.duration * 1000, len(sql_entries), sql_time_ms),
+        "session": "algorand_pera_payment",
+        "init_stack_trace": "[]",
+        "duration": profiler.duration,
+        "entry_count": profiler.entry_count(),
+        "sql_count": len(sql_entries),
+    }
+    for collector in profiler.collectors:
+        if collector.entries:
+            values[collector.name] = json.dumps(collector.entries)
+    # Use a separate cursor so that the capture survives a rollback of the
+    # profiled request
+    with env.registry.cursor() as cr:
+        api.Environment(cr, SUPERUSER_ID, {})["ir.profile"].create(values)
+    _logger.info("[Algorand][profiling] Captured %s", values["name"])
+
+
+def profiled(name, condition=None):
+    """Decorate a controller or model method to capture it when it is slow.
+
+    :param str name: The name of the capture.
+    :param condition: A predicate called with the arguments of the method;
+        the call is only profiled when it returns a truthy value.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if getattr(_local, "active", False) or (
+                condition and not condition(self, *args, **kwargs)
+            ):
+                return func(self, *args, **kwargs)
+            env = self.env if isinstance(self, models.BaseModel) else request.env
+            threshold = _get_threshold(env)
+            if not threshold:
+                return func(self, *args, **kwargs)
+
+            _local.active = True
+            profiler = Profiler(
+                collectors=["sql", "traces_async"], db=None, description=name
+            )
+            try:
+                with profiler:
+                    return func(self, *args, **kwargs)
+            finally:
+                _local.active = False
+                if getattr(profiler, "duration", 0) * 1000 >= threshold:
+                    try:
+                        _save(env, name, profiler)
+                    except Exception:
+                        _logger.exception("[Algorand][profiling] Capture failed")
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,200 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+"""Token-bucket rate limiting of the public Algorand payment routes.
+
+Buckets are kept per client IP, per payment transaction and globally (load
+shedding), in a small SQLite file shared by all the workers of the host. The
+check runs before any ORM access and rejects excess requests immediately
+instead of letting them occupy a worker. Should the shared store be busy or
+unavailable, a per-process in-memory store is used instead.
+
+The limits are read from the server configuration file, e.g.::
+
+    algorand_rate_limit_ip = 30/60
+    algorand_rate_limit_tx = 10/60
+    algorand_rate_limit_global = 300/1
+
+each being ``<capacity>/<seconds to refill it>``.
+"""
+
+import functools
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from odoo.http import request
+from odoo.tools import config
+
+_logger = logging.getLogger(__name__)
+
+DEFAULT_LIMITS = {
+    "ip": "30/60",
+    "tx": "10/60",
+    "global": "300/1",
+}
+STALE_BUCKET_AGE = 3600
+
+
+def _parse_limit(scope):
+    raw = config.get(f"algorand_rate_limit_{scope}") or DEFAULT_LIMITS[scope]
+    capacity, period = str(raw).split("/")
+    capacity = float(capacity)
+    return capacity, capacity / float(period)
+
+
+class MemoryBucketStore:
+    """Per-process token buckets."""
+
+    def __init__(self):
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def consume(self, key, capacity, rate):
+        """Take one token from the bucket `key`.
+
+        :return: 0 if the token was granted, else the seconds to wait for one.
+        :rtype: float
+        """
+        now = time.monotonic()
+        with self._lock:
+            if len(self._buckets) > 100000:
+                self._buckets.clear()
+            tokens, updated = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated) * rate)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return (1 - tokens) / rate
+            self._buckets[key] = (tokens - 1, now)
+            return 0
+
+
+class SqliteBucketStore:
+    """Token buckets shared by the processes of the host through SQLite."""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connection(self):
+        # Connections are neither shared between threads nor across forks
+        cnx = getattr(self._local, "cnx", None)
+        if cnx is None or self._local.pid != os.getpid():
+            cnx = sqlite3.connect(self.path, timeout=0.05, isolation_level=None)
+            cnx.execute("PRAGMA journal_mode=WAL")
+            cnx.execute("PRAGMA synchronous=OFF")
+            cnx.execute(
+                "CREATE TABLE IF NOT EXISTS bucket "
+                "(key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+            )
+            self._local.cnx = cnx
+            self._local.pid = os.getpid()
+        return cnx
+
+    def consume(self, key, capacity, rate):
+        """Take one token from the bucket `key`.
+
+        :return: 0 if the token was granted, else the seconds to wait for one.
+        :rtype: float
+        :raise sqlite3.Error: If the store is locked or unavailable.
+        """
+        now = time.time()
+        cnx = self._connection()
+        cnx.execute("BEGIN IMMEDIATE")
+        try:
+            row = cnx.execute(
+                "SELECT tokens, updated FROM bucket WHERE key = ?", (key,)
+            ).fetchone()
+            tokens, updated = row or (capacity, now)
+            tokens = min(capacity, tokens + max(0, now - updated) * rate)
+            wait = 0 if tokens >= 1 else (1 - tokens) / rate
+            cnx.execute(
+                "INSERT OR REPLACE INTO bucket (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens - 1 if not wait else tokens, now),
+            )
+            if random.random() < 0.001:
+                cnx.execute(
+                    "DELETE FROM bucket WHERE updated < ?", (now - STALE_BUCKET_AGE,)
+                )
+            cnx.execute("COMMIT")
+        except BaseException:
+            cnx.execute("ROLLBACK")
+            raise
+        return wait
+
+
+_memory_store = MemoryBucketStore()
+_shared_store = SqliteBucketStore(
+    config.get("algorand_rate_limit_store")
+    or os.path.join(tempfile.gettempdir(), "odoo_algorand_rate_limit.sqlite3")
+)
+
+
+def _consume(key, scope):
+    capacity, rate = _parse_limit(scope)
+    try:
+        return _shared_store.consume(key, capacity, rate)
+    except sqlite3.Error as e:
+        _logger.debug("[Algorand][rate_limit] Shared store unavailable: %s", e)
+        return _memory_store.consume(key, capacity, rate)
+
+
+def check(client_ip, tx_id=None):
+    """Consume a token from the global, IP and transaction buckets.
+
+    :param str client_ip: The address of the client.
+    :param tx_id: The payment transaction targeted by the request, if any.
+    :return: 0 if the request may proceed, else the seconds to wait.
+    :rtype: float
+    """
+    wait = _consume("global", "global")
+    if not wait:
+        wait = _consume(f"ip:{client_ip}", "ip")
+    if not wait and tx_id:
+        wait = _consume(f"tx:{tx_id}", "tx")
+    return wait
+
+
+def limit(json_route=False):
+    """Decorate a public route to reject excess requests before it runs.
+
+    Rejected HTTP requests get a `429 Too Many Requests` response; JSON-RPC
+    requests, whose errors are always served with a 200 status, get an error
+    result of type `rate_limited`. Both carry the delay before retrying.
+
+    :param bool json_route: Whether the decorated route is a JSON-RPC route.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            wait = check(request.httprequest.remote_addr, kwargs.get("tx_id"))
+            if not wait:
+                return func(self, *args, **kwargs)
+            retry_after = int(wait) + 1
+            _logger.info(
+                "[Algorand][rate_limit] Rejected %s from %s (retry after %ss)",
+                request.httprequest.path,
+                request.httprequest.remote_addr,
+                retry_after,
+            )
+            if json_route:
+                return {
+                    "error": True,
+                    "message": "Too many requests. Please retry shortly.",
+                    "type": "rate_limited",
+                    "retry_after": retry_after,
+                }
+            return request.make_response(
+                "Too Many Requests",
+                headers=[("Retry-After", str(retry_after))],
+                status=429,
+            )
+
+        return wrapper
+
+    return decorator
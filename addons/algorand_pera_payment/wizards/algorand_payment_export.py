@@ -0,0 +1,57 @@
+# Copyright 2025 Odoo Community Association (OCA)
+# License AGPL-3.0 or later (https://www.gnu.org/licenses/agpl).
+
+from urllib.parse import urlencode
+
+from odoo import _, api, fields, models
+from odoo.exceptions import ValidationError
+from odoo.tools import date_utils
+
+
+class AlgorandPaymentExport(models.TransientModel):
+    """Download the Algorand payments of a period as CSV or XLSX.
+
+    The file is streamed by the `/payment/algorand_pera/export` route rather
+    than built by the standard list export, so that it works for any number
+    of payments.
+    """
+
+    _name = "algorand.payment.export"
+    _description = "Algorand Payment Export"
+
+    date_from = fields.Date(
+        required=True,
+        default=lambda self: date_utils.start_of(
+            fields.Date.context_today(self), "year"
+        ),
+    )
+    date_to = fields.Date(
+        required=True,
+        default=fields.Date.context_today,
+    )
+    file_format = fields.Selection(
+        selection=[("csv", "CSV"), ("xlsx", "Excel (XLSX)")],
+        required=True,
+        default="csv",
+    )
+
+    @api.constrains("date_from", "date_to")
+    def _check_dates(self):
+        for wizard in self:
+            if wizard.date_from > wizard.date_to:
+                raise ValidationError(_("The start date must be before the end date."))
+
+    def action_export(self):
+        self.ensure_one()
+        query = urlencode(
+            {
+                "date_from": fields.Date.to_string(self.date_from),
+                "date_to": fields.Date.to_string(self.date_to),
+                "file_format": self.file_format,
+            }
+        )
+        return {
+            "type": "ir.actions.act_url",
+            "url": f"/payment/algorand_pera/export?{query}",
+            "target": "download",
+        }